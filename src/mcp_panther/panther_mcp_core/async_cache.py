@@ -0,0 +1,149 @@
+"""
+Time-bounded memoization for async functions.
+
+Agents often re-read the same alert a few seconds apart. async_ttl_cache keeps
+recent results in memory so those repeat reads skip the Panther API entirely,
+and single_flight lets concurrent identical calls share one request.
+"""
+
+import asyncio
+import copy
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+_MISS = object()
+
+
+def _make_key(
+    signature: inspect.Signature, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Tuple[Hashable, ...]:
+    """Key a call on its bound arguments, so positional and keyword calls match."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return tuple(bound.arguments.values())
+
+
+def async_ttl_cache(
+    maxsize: int = 512,
+    ttl: float = 30,
+    cache_if: Optional[Callable[[Any], bool]] = None,
+) -> Callable:
+    """Cache the results of an async function for a limited time.
+
+    Entries are keyed on the bound call arguments, so positional and keyword
+    calls share an entry. Cached results are deep-copied on the way out so that
+    callers cannot modify each other's data. When the cache is full the least
+    recently used entry is evicted. Concurrent misses for the same key wait on a
+    per-key lock, so only one of them calls the function.
+
+    The decorated function gains two helpers:
+    - cache_invalidate(*args): drop entries whose leading arguments equal args
+    - cache_clear(): drop all entries
+
+    Example:
+        @async_ttl_cache(ttl=15, cache_if=lambda result: result["success"])
+        async def get_alert_by_id(alert_id: str) -> Dict[str, Any]:
+            ...
+
+    Args:
+        maxsize: Maximum number of entries to keep
+        ttl: Number of seconds an entry stays valid
+        cache_if: Optional predicate deciding whether a result may be cached
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        cache: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+
+        # Per-key lock and the number of callers holding or waiting on it
+        locks: Dict[Tuple[Hashable, ...], List[Any]] = {}
+
+        def lookup(key: Tuple[Hashable, ...]) -> Any:
+            entry = cache.get(key)
+            if entry is None:
+                return _MISS
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del cache[key]
+                return _MISS
+            cache.move_to_end(key)
+            return copy.deepcopy(value)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _make_key(signature, args, kwargs)
+            value = lookup(key)
+            if value is not _MISS:
+                return value
+
+            lock_entry = locks.setdefault(key, [asyncio.Lock(), 0])
+            lock_entry[1] += 1
+            try:
+                async with lock_entry[0]:
+                    # Another caller may have filled the entry while we waited
+                    value = lookup(key)
+                    if value is not _MISS:
+                        return value
+
+                    result = await func(*args, **kwargs)
+                    if cache_if is None or cache_if(result):
+                        cache[key] = (time.monotonic() + ttl, copy.deepcopy(result))
+                        if len(cache) > maxsize:
+                            cache.popitem(last=False)
+                    return result
+            finally:
+                lock_entry[1] -= 1
+                if not lock_entry[1]:
+                    del locks[key]
+
+        def cache_invalidate(*args: Hashable) -> None:
+            for key in [key for key in cache if key[: len(args)] == args]:
+                del cache[key]
+
+        wrapper.cache_invalidate = cache_invalidate
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def single_flight(func: Callable) -> Callable:
+    """Share one in-flight call between concurrent callers with the same arguments.
+
+    Unlike async_ttl_cache nothing is kept once the call finishes, so it suits
+    results that must always be fresh. Callers that join an in-flight call get a
+    deep copy of its result, or the exception it raised.
+    """
+    signature = inspect.signature(func)
+    inflight: Dict[Tuple[Hashable, ...], asyncio.Future] = {}
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        key = _make_key(signature, args, kwargs)
+
+        future = inflight.get(key)
+        if future is not None:
+            # Shield the shared call so a cancelled follower does not cancel it
+            return copy.deepcopy(await asyncio.shield(future))
+
+        future = inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no caller joined
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del inflight[key]
+
+    return wrapper
@@ -1,14 +1,51 @@
+import asyncio
+import codecs
+import contextlib
 import datetime
+import functools
+import gc
 import json
 import logging
 import os
 import re
+import time
+import types
+import weakref
+from html.parser import HTMLParser
 from importlib.metadata import version
-from typing import Any, AnyStr, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    AnyStr,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import aiohttp
+import pydantic_core
 from gql import Client, gql
+from gql.client import AsyncClientSession
 from gql.transport.aiohttp import AIOHTTPTransport
+from gql.transport.exceptions import TransportClosed, TransportServerError
+from graphql import DocumentNode, print_ast
+from multidict import CIMultiDict
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is an optional speedup
+    ijson = None
 
 PACKAGE_NAME = "mcp-panther"
 
@@ -16,16 +53,256 @@ PACKAGE_NAME = "mcp-panther"
 logger = logging.getLogger(PACKAGE_NAME)
 
 
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Encode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+class RawJSON:
+    """An encoded JSON value that serialize_tool_result embeds in a tool result.
+
+    Lets a tool return a response body from Panther without decoding it and
+    encoding it again.
+    """
+
+    __slots__ = ("body",)
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, RawJSON):
+        return orjson.Fragment(obj.body)
+    return str(obj)
+
+
+def _pydantic_fallback(obj: Any) -> Any:
+    if isinstance(obj, RawJSON):
+        return _json_loads(obj.body)
+    return str(obj)
+
+
+def serialize_tool_result(data: Any) -> str:
+    """Serialize a tool's return value for the MCP response.
+
+    Produces the same indented JSON as FastMCP's default serializer, but encodes
+    with orjson when it is installed. RawJSON values are spliced in as is with
+    orjson, and decoded and encoded again without it.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=_orjson_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return pydantic_core.to_json(data, fallback=_pydantic_fallback, indent=2).decode()
+
+
+def _iter_json_prefix(obj: Any, parts: Sequence[str]) -> Any:
+    """Yield the values of an already decoded document at an ijson-style prefix.
+
+    Args:
+        obj: The decoded JSON document
+        parts: The prefix split on dots, where "item" selects each list element
+    """
+    if not parts:
+        yield obj
+        return
+    head, rest = parts[0], parts[1:]
+    if head == "item" and isinstance(obj, list):
+        for value in obj:
+            yield from _iter_json_prefix(value, rest)
+    elif isinstance(obj, dict) and head in obj:
+        yield from _iter_json_prefix(obj[head], rest)
+
+
+# Matches script tags that have an id attribute, capturing the id and the tag body
+_SCRIPT_TAG_RE = re.compile(
+    r"<script[^>]*id=[\"']([^\"']+)[\"'][^>]*>(.*?)</script>", re.DOTALL
+)
+
+# Whether to verify TLS certificates, read once from the environment at import
+_SSL_VERIFY: bool = not os.getenv("PANTHER_ALLOW_INSECURE_INSTANCE")
+
+# Status codes accepted by default for read and write REST requests
+_OK_GET = frozenset({200})
+_OK_WRITE = frozenset({200, 201})
+
+# Connection pool settings for the long-lived aiohttp sessions. All requests go
+# to a single Panther host, so cache DNS and keep connections alive for reuse.
+# PANTHER_POOL_SIZE sets how many connections may be open to that host at once.
+_CONNECTOR_LIMIT_PER_HOST = int(os.getenv("PANTHER_POOL_SIZE", "64"))
+_CONNECTOR_LIMIT = max(256, _CONNECTOR_LIMIT_PER_HOST)
+_DNS_CACHE_TTL_SECONDS = 300
+_KEEPALIVE_TIMEOUT_SECONDS = 75
+_SESSION_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60)
+
+# Responses at least this large are decoded with garbage collection paused
+_GC_PAUSE_MIN_BYTES = 1024 * 1024
+
+# Size of the chunks read from the response when scanning for a script tag
+_SCRIPT_TAG_CHUNK_SIZE = 16384
+
+
 class UnexpectedResponseStatusError(ValueError):
     pass
 
 
+class _ScriptTagParser(HTMLParser):
+    """HTML parser that captures the body of the script tag with a given ID.
+
+    Parsing can stop as soon as ``done`` is set, so the rest of the document
+    does not need to be read.
+    """
+
+    def __init__(self, script_id: str):
+        super().__init__(convert_charrefs=False)
+        self._script_id = script_id
+        self._in_target = False
+        self._parts: List[str] = []
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "script" and dict(attrs).get("id") == self._script_id:
+            self._in_target = True
+
+    def handle_data(self, data):
+        if self._in_target:
+            self._parts.append(data)
+
+    def handle_endtag(self, tag):
+        if self._in_target and tag == "script":
+            self._in_target = False
+            self.done = True
+
+    @property
+    def result(self) -> Optional[str]:
+        """The captured script body, or None if the tag was not fully read."""
+        return "".join(self._parts) if self.done else None
+
+
+# Shared session used to fetch the instance configuration
+_config_session: Optional[aiohttp.ClientSession] = None
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause cyclic garbage collection, restoring its previous state on exit.
+
+    Decoding a large response allocates many containers that all survive, and
+    each batch of them would otherwise trigger a collection that finds nothing.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+class _JSONClientResponse(aiohttp.ClientResponse):
+    """Response that decodes JSON bodies with orjson when it is installed.
+
+    gql's AIOHTTPTransport calls response.json() without a loads argument, so
+    the decoder is swapped in through the session's response class. Large
+    bodies are decoded with garbage collection paused.
+    """
+
+    async def json(self, *, loads: Callable[[str], Any] = _json_loads, **kwargs):
+        body = await self.read()
+        if len(body) < _GC_PAUSE_MIN_BYTES:
+            return await super().json(loads=loads, **kwargs)
+        # The body has been read, so decoding runs without yielding to the loop
+        with _gc_paused():
+            return await super().json(loads=loads, **kwargs)
+
+
+def _new_connector() -> aiohttp.TCPConnector:
+    """Create a TCP connector whose pool is sized for concurrent tool calls.
+
+    Returns:
+        aiohttp.TCPConnector: The new connector, owned by the session using it
+    """
+    return aiohttp.TCPConnector(
+        limit=_CONNECTOR_LIMIT,
+        limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+        ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+    )
+
+
+def _new_client_session(**kwargs: Any) -> aiohttp.ClientSession:
+    """Create an aiohttp session with a connection pool tuned for reuse.
+
+    Args:
+        **kwargs: Additional arguments passed to aiohttp.ClientSession
+
+    Returns:
+        aiohttp.ClientSession: The new session
+    """
+    return aiohttp.ClientSession(
+        connector=_new_connector(), timeout=_SESSION_TIMEOUT, **kwargs
+    )
+
+
+async def _get_config_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session used for configuration lookups.
+
+    The session is lazily created on first use and reused across calls so that
+    repeated lookups can take advantage of connection pooling and keep-alive.
+
+    Returns:
+        aiohttp.ClientSession: The shared session
+    """
+    global _config_session
+    if _config_session is None or _config_session.closed:
+        _config_session = _new_client_session()
+    return _config_session
+
+
+# Long-lived GraphQL client and session shared by _execute_query
+_gql_client: Optional[Client] = None
+_gql_session: Optional[AsyncClientSession] = None
+_gql_session_lock = asyncio.Lock()
+
+
+async def close_client_sessions() -> None:
+    """Close any shared HTTP sessions held by this module.
+
+    This should be called once when the server shuts down.
+    """
+    global _config_session, _gql_client, _gql_session
+    if _rest_client is not None:
+        await _rest_client.close()
+    if _config_session is not None:
+        await _config_session.close()
+        _config_session = None
+    if _gql_client is not None:
+        await _gql_client.close_async()
+        _gql_client = None
+        _gql_session = None
+
+
 async def get_json_from_script_tag(
     url: str, script_id: str
 ) -> Optional[Union[Dict[str, Any], AnyStr]]:
     """
     Extract JSON content from a script tag with the specified ID using aiohttp.
 
+    The response body is parsed as it streams in, and parsing stops as soon as
+    the script tag has been found.
+
     Args:
         url: The URL to fetch
         script_id: The ID of the script tag containing JSON
@@ -33,39 +310,68 @@ async def get_json_from_script_tag(
     Returns:
         Parsed JSON content, raw string if not valid JSON, or None if not found
     """
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            url, ssl=not os.getenv("PANTHER_ALLOW_INSECURE_INSTANCE")
-        ) as response:
-            if response.status != 200:
-                raise UnexpectedResponseStatusError(
-                    f"unexpected status code when resolving api info: {response.status}"
-                )
-
-            html_content: str = await response.text()
-
-    # Pattern to match script tag with specific ID and capture its content
-    pattern: str = f"<script[^>]*id=[\"']{script_id}[\"'][^>]*>(.*?)</script>"
-    match: Optional[re.Match] = re.search(pattern, html_content, re.DOTALL)
-
-    if match:
-        json_str: AnyStr = match.group(1).strip()
-        return json.loads(json_str)
+    session = await _get_config_session()
+    async with session.get(url, ssl=_SSL_VERIFY) as response:
+        if response.status != 200:
+            raise UnexpectedResponseStatusError(
+                f"unexpected status code when resolving api info: {response.status}"
+            )
+
+        parser = _ScriptTagParser(script_id)
+        decoder = codecs.getincrementaldecoder(response.charset or "utf-8")("replace")
+        html_parts: List[str] = []
+        parse_failed = False
+        chunks = response.content.iter_chunked(_SCRIPT_TAG_CHUNK_SIZE)
+        async for chunk in chunks:
+            text = decoder.decode(chunk)
+            html_parts.append(text)
+            if parse_failed:
+                continue
+            try:
+                parser.feed(text)
+            except Exception as e:
+                logger.debug("Failed to parse HTML, falling back to regex: %s", e)
+                parse_failed = True
+            if parser.done:
+                break
+        html_parts.append(decoder.decode(b"", True))
+
+        # Drain the rest of the body unparsed, so the connection goes back to
+        # the pool instead of being closed
+        async for _ in chunks:
+            pass
+
+    if parser.result is not None:
+        return _json_loads(parser.result.strip())
+
+    # Fall back to a regex scan of everything that was read
+    html_content: str = "".join(html_parts)
+    for match in _SCRIPT_TAG_RE.finditer(html_content):
+        if match.group(1) == script_id:
+            json_str: AnyStr = match.group(2).strip()
+            return _json_loads(json_str)
 
     raise ValueError("could not find json info")
 
 
+@functools.cache
 def get_panther_api_key() -> str:
-    """Get Panther API key from environment variable"""
+    """Get Panther API key from environment variable.
+
+    The value is cached after the first successful read.
+    """
     api_key = os.getenv("PANTHER_API_TOKEN")
     if not api_key:
         raise ValueError("PANTHER_API_TOKEN environment variable is not set")
     return api_key
 
 
+@functools.cache
 def get_panther_instance_url() -> str:
     """Get the Panther instance URL from environment variable.
 
+    The value is cached after the first successful read.
+
     Returns:
         str: The Panther instance URL from PANTHER_INSTANCE_URL environment variable
     """
@@ -76,31 +382,46 @@ def get_panther_instance_url() -> str:
     return result
 
 
+# How long a fetched instance configuration is reused before it is refreshed
+INSTANCE_CONFIG_TTL_SECONDS = 3600
+
 instance_config: Optional[Dict[str, Any]] = None
+_instance_config_expiry: float = 0.0
+_instance_config_lock = asyncio.Lock()
 
 
 async def get_instance_config() -> Optional[Dict[str, Any]]:
     """Retrieve and cache the Panther instance configuration from the instance URL.
 
+    The configuration is cached for INSTANCE_CONFIG_TTL_SECONDS. Concurrent
+    callers share a single fetch rather than each fetching it themselves.
+
     Returns:
         Optional[Dict[str, Any]]: The Panther instance configuration dictionary if successful,
                                  None if the instance URL is not set or configuration cannot be fetched.
     """
-    global instance_config
-    instance_url = get_panther_instance_url()
-    if instance_config is None:
-        try:
-            info = await get_json_from_script_tag(instance_url, "__PANTHER_CONFIG__")
-            instance_config = info
-        except UnexpectedResponseStatusError:
-            if "public/graphql" in instance_url:
-                instance_config = {
-                    "rest": instance_url.replace("public/graphql", "").strip("/")
-                }
-            else:
-                instance_config = {
-                    "rest": instance_url.strip("/"),
-                }
+    global instance_config, _instance_config_expiry
+    if instance_config is not None and time.monotonic() < _instance_config_expiry:
+        return instance_config
+
+    async with _instance_config_lock:
+        if instance_config is None or time.monotonic() >= _instance_config_expiry:
+            instance_url = get_panther_instance_url()
+            try:
+                info = await get_json_from_script_tag(
+                    instance_url, "__PANTHER_CONFIG__"
+                )
+                instance_config = info
+            except UnexpectedResponseStatusError:
+                if "public/graphql" in instance_url:
+                    instance_config = {
+                        "rest": instance_url.replace("public/graphql", "").strip("/")
+                    }
+                else:
+                    instance_config = {
+                        "rest": instance_url.strip("/"),
+                    }
+            _instance_config_expiry = time.monotonic() + INSTANCE_CONFIG_TTL_SECONDS
 
     return instance_config
 
@@ -150,6 +471,7 @@ async def get_panther_gql_endpoint() -> str:
     return base + "/public/graphql"
 
 
+@functools.cache
 def _is_running_in_docker() -> bool:
     """Check if the process is running inside a Docker container.
 
@@ -159,9 +481,13 @@ def _is_running_in_docker() -> bool:
     return os.environ.get("MCP_PANTHER_DOCKER_RUNTIME") == "true"
 
 
+@functools.cache
 def _get_user_agent() -> str:
     """Get the user agent string for API requests.
 
+    The result is computed once per process since the package version and
+    runtime environment do not change.
+
     Returns:
         str: User agent string in format '{PACKAGE_NAME}/{version} (Python)' or '{PACKAGE_NAME}/{version} (Python; Docker)'
     """
@@ -169,7 +495,7 @@ def _get_user_agent() -> str:
         package_version = version(PACKAGE_NAME)
         base_agent = f"{PACKAGE_NAME}/{package_version}"
     except Exception as e:
-        logger.debug(f"Failed to get package version: {e}")
+        logger.debug("Failed to get package version: %s", e)
         base_agent = f"{PACKAGE_NAME}/development"
 
     env_info = ["Python"]
@@ -179,17 +505,104 @@ def _get_user_agent() -> str:
     return f"{base_agent} ({'; '.join(env_info)})"
 
 
+# Printed query text keyed by document, so each document is only serialized once
+_printed_documents: "weakref.WeakKeyDictionary[DocumentNode, str]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _print_document(document: DocumentNode) -> str:
+    """Print a GraphQL document, reusing the text from earlier requests.
+
+    Args:
+        document: The parsed query document
+
+    Returns:
+        str: The query text sent to the GraphQL endpoint
+    """
+    printed = _printed_documents.get(document)
+    if printed is None:
+        printed = _printed_documents[document] = print_ast(document)
+    return printed
+
+
+def _with_cached_printing(method: Callable) -> Callable:
+    """Copy a gql transport method, resolving its print_ast to _print_document.
+
+    The copy runs gql's own code, so it keeps up with gql releases, and only
+    the copy sees the replacement: gql's module and other transports are left
+    untouched.
+    """
+    copy = types.FunctionType(
+        method.__code__,
+        {**method.__globals__, "print_ast": _print_document},
+        method.__name__,
+        method.__defaults__,
+        method.__closure__,
+    )
+    copy.__kwdefaults__ = method.__kwdefaults__
+    return functools.update_wrapper(copy, method)
+
+
+class _PantherTransport(AIOHTTPTransport):
+    """AIOHTTPTransport that prints each query document only once.
+
+    The stock execute prints the document AST on every request. This transport
+    runs the stock execute with the query text cached by _print_document.
+    """
+
+    execute = _with_cached_printing(AIOHTTPTransport.execute)
+
+    async def execute_raw(
+        self,
+        document: DocumentNode,
+        variable_values: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """Post a query and return the response body without decoding it.
+
+        HTTP errors raise TransportServerError like execute, but GraphQL errors
+        are left in the body for the caller.
+
+        Args:
+            document: The parsed query document
+            variable_values: The variables to pass to the query
+
+        Returns:
+            bytes: The JSON response body
+        """
+        if self.session is None:
+            raise TransportClosed("Transport is not connected")
+
+        payload: Dict[str, Any] = {"query": _print_document(document)}
+        if variable_values:
+            payload["variables"] = variable_values
+
+        async with self.session.post(self.url, ssl=self.ssl, json=payload) as resp:
+            self.response_headers = resp.headers
+            try:
+                resp.raise_for_status()
+            except aiohttp.ClientResponseError as e:
+                raise TransportServerError(str(e), e.status) from e
+            return await resp.read()
+
+
 async def _create_panther_client() -> Client:
     """Create a Panther GraphQL client with proper configuration"""
-    transport = AIOHTTPTransport(
+    transport = _PantherTransport(
         url=await get_panther_gql_endpoint(),
         headers={
             "X-API-Key": get_panther_api_key(),
             "User-Agent": _get_user_agent(),
         },
         ssl=True,  # Enable SSL verification
+        json_serialize=_json_dumps,
+        # Size the pool so concurrent queries on the shared session run in parallel
+        client_session_args={
+            "connector": _new_connector(),
+            "response_class": _JSONClientResponse,
+        },
     )
-    return Client(transport=transport, fetch_schema_from_transport=True)
+    return Client(transport=transport, fetch_schema_from_transport=False)
 
 
 def graphql_date_format(input_date: datetime) -> str:
@@ -207,87 +620,178 @@ def graphql_date_format(input_date: datetime) -> str:
     return input_date.isoformat(timespec="milliseconds").replace("+00:00", "Z")
 
 
-def get_today_date_range() -> Tuple[datetime.datetime, datetime.datetime]:
-    """Get date range for the last 24 hours (UTC)"""
-    # Get current UTC time and shift back by one day since we're already in tomorrow
+def _current_range_ordinal() -> int:
+    """Get the ordinal of the UTC day covered by the default date range."""
+    # Shift back by one day since we're already in tomorrow
     now = datetime.datetime.now(datetime.timezone.utc)
-    now = now - datetime.timedelta(days=1)
+    return (now - datetime.timedelta(days=1)).toordinal()
+
 
-    # Get start of today (midnight UTC)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+@functools.lru_cache(maxsize=2)
+def _today_range_for_ordinal(
+    ordinal: int,
+) -> Tuple[datetime.datetime, datetime.datetime]:
+    """Get the UTC day boundaries for the given day ordinal.
 
-    # Get end of today (midnight UTC of next day)
+    Args:
+        ordinal: The proleptic Gregorian ordinal of the day
+
+    Returns:
+        Tuple of midnight UTC at the start and end of the day
+    """
+    today_start = datetime.datetime.combine(
+        datetime.date.fromordinal(ordinal),
+        datetime.time.min,
+        tzinfo=datetime.timezone.utc,
+    )
     today_end = today_start + datetime.timedelta(days=1)
+    return today_start, today_end
+
+
+@functools.lru_cache(maxsize=2)
+def _today_range_strings_for_ordinal(ordinal: int) -> Tuple[str, str]:
+    """Get the GraphQL-formatted UTC day boundaries for the given day ordinal.
 
-    logger.debug(f"Calculated date range - Start: {today_start}, End: {today_end}")
+    Args:
+        ordinal: The proleptic Gregorian ordinal of the day
+
+    Returns:
+        Tuple of ISO 8601 strings with milliseconds and Z suffix
+    """
+    today_start, today_end = _today_range_for_ordinal(ordinal)
+    return (
+        f"{today_start:%Y-%m-%dT%H:%M:%S}.000Z",
+        f"{today_end:%Y-%m-%dT%H:%M:%S}.000Z",
+    )
+
+
+def get_today_date_range() -> Tuple[datetime.datetime, datetime.datetime]:
+    """Get date range for the last 24 hours (UTC)"""
+    today_start, today_end = _today_range_for_ordinal(_current_range_ordinal())
+    logger.debug("Calculated date range - Start: %s, End: %s", today_start, today_end)
     return today_start, today_end
 
 
 def _get_today_date_range() -> Tuple[str, str]:
     """Get date range for the last 24 hours (UTC)"""
-    # Get current UTC time and shift back by one day since we're already in tomorrow
-    now = datetime.datetime.now(datetime.timezone.utc)
-    now = now - datetime.timedelta(days=1)
+    start_date, end_date = _today_range_strings_for_ordinal(_current_range_ordinal())
+    logger.debug("Calculated date range - Start: %s, End: %s", start_date, end_date)
+    return start_date, end_date
 
-    # Get start of today (midnight UTC)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    # Get end of today (midnight UTC of next day)
-    today_end = today_start + datetime.timedelta(days=1)
+def _gql_transport_closed() -> bool:
+    """Check whether the shared GraphQL client's HTTP session has been closed."""
+    if _gql_client is None:
+        return False
+    session = _gql_client.transport.session
+    return session is None or session.closed
 
-    # Format for GraphQL query (ISO 8601 with milliseconds and Z suffix)
-    start_date = today_start.isoformat(timespec="milliseconds").replace("+00:00", "Z")
-    end_date = today_end.isoformat(timespec="milliseconds").replace("+00:00", "Z")
 
-    logger.debug(f"Calculated date range - Start: {start_date}, End: {end_date}")
-    return start_date, end_date
+async def _get_gql_session() -> AsyncClientSession:
+    """Get the shared GraphQL session, connecting it on first use.
+
+    The session is kept open for the lifetime of the process so that the
+    underlying transport can reuse its connections across queries. aiohttp
+    replaces dropped connections on its own; if the HTTP session itself has
+    been closed, a new client with a fresh connector is created, since the
+    closed session also closed the connector it owned.
 
+    Returns:
+        AsyncClientSession: The connected GraphQL session
+    """
+    global _gql_client, _gql_session
+    if _gql_session is None or _gql_transport_closed():
+        async with _gql_session_lock:
+            if _gql_session is None or _gql_transport_closed():
+                # A closed client has nothing left to release, and closing
+                # it again through gql fails on its missing connector
+                client = await _create_panther_client()
+                _gql_session = await client.connect_async()
+                _gql_client = client
+    return _gql_session
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_query(query: str) -> DocumentNode:
+    """Parse a GraphQL query string, caching the resulting document.
 
-async def _execute_query(query: gql, variables: Dict[str, Any]) -> Dict[str, Any]:
+    Args:
+        query: The GraphQL query text
+
+    Returns:
+        DocumentNode: The parsed query document
+    """
+    return gql(query)
+
+
+async def _execute_query(
+    query: Union[DocumentNode, str], variables: Dict[str, Any]
+) -> Dict[str, Any]:
     """Execute a GraphQL query with the given variables.
 
     Args:
-        query: The GraphQL query to execute
+        query: The GraphQL query to execute, either pre-parsed or as query text
         variables: The variables to pass to the query
 
     Returns:
         The query result as a dictionary
     """
-    client = await _create_panther_client()
-    async with client as session:
-        return await session.execute(query, variable_values=variables)
+    if isinstance(query, str):
+        query = _parse_query(query)
+    session = await _get_gql_session()
+    return await session.execute(query, variable_values=variables)
 
 
 class PantherRestClient:
     """A client for making REST API calls to Panther's API.
 
     This client handles session management, URL construction, and default headers.
-    It uses aiohttp for making async HTTP requests.
+    It uses aiohttp for making async HTTP requests. A single session is opened on
+    first use and shared across requests until close() is called.
     """
 
     def __init__(self):
         self._session: Optional[aiohttp.ClientSession] = None
         self._base_url: Optional[str] = None
-        self._headers: Optional[Dict[str, str]] = None
+        self._headers: Optional[CIMultiDict[str]] = None
 
-    async def __aenter__(self) -> "PantherRestClient":
-        """Set up the client session when entering an async context."""
-        if not self._session:
-            self._session = aiohttp.ClientSession()
-            self._base_url = await get_panther_rest_api_base()
-            self._headers = {
-                "X-API-Key": get_panther_api_key(),
-                "Content-Type": "application/json",
-                "User-Agent": _get_user_agent(),
-            }
-        return self
+    async def _ensure_session(self) -> None:
+        """Lazily open the shared client session on first use.
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Clean up the client session when exiting an async context."""
+        The session is kept open across requests so that connections can be
+        reused. It is only recreated if it has been closed.
+        """
+        if self._session is None or self._session.closed:
+            base_url = await get_panther_rest_api_base()
+            if self._session is None or self._session.closed:
+                self._base_url = base_url
+                if self._headers is None:
+                    # Built once so aiohttp can use the headers without
+                    # normalizing them on every request
+                    self._headers = CIMultiDict(
+                        {
+                            "X-API-Key": get_panther_api_key(),
+                            "Content-Type": "application/json",
+                            "User-Agent": _get_user_agent(),
+                        }
+                    )
+                self._session = _new_client_session(json_serialize=_json_dumps)
+
+    async def close(self) -> None:
+        """Close the underlying client session."""
         if self._session:
             await self._session.close()
             self._session = None
 
+    async def __aenter__(self) -> "PantherRestClient":
+        """Make sure the shared session is open when entering an async context."""
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Leave the shared session open so it can be reused by later calls."""
+        return None
+
     def _build_url(self, path: str) -> str:
         """Construct the full URL for a given path.
 
@@ -303,13 +807,13 @@ class PantherRestClient:
         return f"{self._base_url}/{path}"
 
     async def _validate_response(
-        self, response: aiohttp.ClientResponse, expected_codes: List[int]
+        self, response: aiohttp.ClientResponse, expected_codes: Collection[int]
     ) -> None:
         """Validate the response status code against expected codes.
 
         Args:
             response: The aiohttp ClientResponse object
-            expected_codes: List of acceptable status codes
+            expected_codes: Collection of acceptable status codes
 
         Raises:
             Exception: If the status code is not in the expected codes
@@ -322,18 +826,48 @@ class PantherRestClient:
                 )
             raise Exception(f"Request failed (HTTP {response.status}): {error_text}")
 
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        expected_codes: Collection[int],
+        **kwargs: Any,
+    ) -> Tuple[Dict[str, Any], int]:
+        """Make a request to the Panther API and decode the JSON response.
+
+        Args:
+            method: The HTTP method to use
+            path: The API path
+            expected_codes: Status codes considered successful
+            **kwargs: Additional arguments passed to the aiohttp request
+
+        Returns:
+            Tuple[Dict[str, Any], int]: The JSON response and the HTTP status code
+        """
+        await self._ensure_session()
+
+        async with self._session.request(
+            method,
+            self._build_url(path),
+            headers=self._headers,
+            ssl=_SSL_VERIFY,
+            **kwargs,
+        ) as response:
+            await self._validate_response(response, expected_codes)
+            return await response.json(loads=_json_loads), response.status
+
     async def get(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
-        expected_codes: List[int] = [200],
+        expected_codes: Collection[int] = _OK_GET,
     ) -> Tuple[Dict[str, Any], int]:
         """Make a GET request to the Panther API.
 
         Args:
             path: The API path (e.g., '/rules' or '/rules/{rule_id}')
             params: Optional query parameters
-            expected_codes: List of status codes considered successful (default: [200])
+            expected_codes: Status codes considered successful (default: {200})
 
         Returns:
             Tuple[Dict[str, Any], int]: A tuple containing:
@@ -343,24 +877,19 @@ class PantherRestClient:
         Raises:
             Exception: If the request fails or returns an unexpected status code
         """
-        if not self._session:
-            raise RuntimeError("Client must be used within an async context manager")
-
-        async with self._session.get(
-            self._build_url(path),
-            headers=self._headers,
+        return await self._request(
+            "GET",
+            path,
+            expected_codes,
             params=params,
-            ssl=not os.getenv("PANTHER_ALLOW_INSECURE_INSTANCE"),
-        ) as response:
-            await self._validate_response(response, expected_codes)
-            return await response.json(), response.status
+        )
 
     async def post(
         self,
         path: str,
         json_data: Dict[str, Any],
         params: Optional[Dict[str, Any]] = None,
-        expected_codes: List[int] = [200, 201],
+        expected_codes: Collection[int] = _OK_WRITE,
     ) -> Tuple[Dict[str, Any], int]:
         """Make a POST request to the Panther API.
 
@@ -368,7 +897,7 @@ class PantherRestClient:
             path: The API path (e.g., '/rules')
             json_data: The JSON data to send in the request body
             params: Optional query parameters
-            expected_codes: List of status codes considered successful (default: [200, 201])
+            expected_codes: Status codes considered successful (default: {200, 201})
 
         Returns:
             Tuple[Dict[str, Any], int]: A tuple containing:
@@ -378,25 +907,20 @@ class PantherRestClient:
         Raises:
             Exception: If the request fails or returns an unexpected status code
         """
-        if not self._session:
-            raise RuntimeError("Client must be used within an async context manager")
-
-        async with self._session.post(
-            self._build_url(path),
-            headers=self._headers,
-            json=json_data,
+        return await self._request(
+            "POST",
+            path,
+            expected_codes,
             params=params,
-            ssl=not os.getenv("PANTHER_ALLOW_INSECURE_INSTANCE"),
-        ) as response:
-            await self._validate_response(response, expected_codes)
-            return await response.json(), response.status
+            json=json_data,
+        )
 
     async def put(
         self,
         path: str,
         json_data: Dict[str, Any],
         params: Optional[Dict[str, Any]] = None,
-        expected_codes: List[int] = [200, 201],
+        expected_codes: Collection[int] = _OK_WRITE,
     ) -> Tuple[Dict[str, Any], int]:
         """Make a PUT request to the Panther API.
 
@@ -404,7 +928,7 @@ class PantherRestClient:
             path: The API path (e.g., '/rules/{rule_id}')
             json_data: The JSON data to send in the request body
             params: Optional query parameters
-            expected_codes: List of status codes considered successful (default: [200, 201])
+            expected_codes: Status codes considered successful (default: {200, 201})
 
         Returns:
             Tuple[Dict[str, Any], int]: A tuple containing:
@@ -414,25 +938,20 @@ class PantherRestClient:
         Raises:
             Exception: If the request fails or returns an unexpected status code
         """
-        if not self._session:
-            raise RuntimeError("Client must be used within an async context manager")
-
-        async with self._session.put(
-            self._build_url(path),
-            headers=self._headers,
-            json=json_data,
+        return await self._request(
+            "PUT",
+            path,
+            expected_codes,
             params=params,
-            ssl=not os.getenv("PANTHER_ALLOW_INSECURE_INSTANCE"),
-        ) as response:
-            await self._validate_response(response, expected_codes)
-            return await response.json(), response.status
+            json=json_data,
+        )
 
     async def patch(
         self,
         path: str,
         json_data: Dict[str, Any],
         params: Optional[Dict[str, Any]] = None,
-        expected_codes: List[int] = [200, 201],
+        expected_codes: Collection[int] = _OK_WRITE,
     ) -> Tuple[Dict[str, Any], int]:
         """Make a PATCH request to the Panther API.
 
@@ -440,7 +959,7 @@ class PantherRestClient:
             path: The API path (e.g., '/rules/{rule_id}')
             json_data: The JSON data to send in the request body
             params: Optional query parameters
-            expected_codes: List of status codes considered successful (default: [200, 201])
+            expected_codes: Status codes considered successful (default: {200, 201})
 
         Returns:
             Tuple[Dict[str, Any], int]: A tuple containing:
@@ -450,31 +969,26 @@ class PantherRestClient:
         Raises:
             Exception: If the request fails or returns an unexpected status code
         """
-        if not self._session:
-            raise RuntimeError("Client must be used within an async context manager")
-
-        async with self._session.patch(
-            self._build_url(path),
-            headers=self._headers,
-            json=json_data,
+        return await self._request(
+            "PATCH",
+            path,
+            expected_codes,
             params=params,
-            ssl=not os.getenv("PANTHER_ALLOW_INSECURE_INSTANCE"),
-        ) as response:
-            await self._validate_response(response, expected_codes)
-            return await response.json(), response.status
+            json=json_data,
+        )
 
     async def delete(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
-        expected_codes: List[int] = [200],
+        expected_codes: Collection[int] = _OK_GET,
     ) -> Tuple[Dict[str, Any], int]:
         """Make a DELETE request to the Panther API.
 
         Args:
             path: The API path (e.g., '/rules/{rule_id}')
             params: Optional query parameters
-            expected_codes: List of status codes considered successful (default: [200])
+            expected_codes: Status codes considered successful (default: {200})
 
         Returns:
             Tuple[Dict[str, Any], int]: A tuple containing:
@@ -484,17 +998,128 @@ class PantherRestClient:
         Raises:
             Exception: If the request fails or returns an unexpected status code
         """
-        if not self._session:
-            raise RuntimeError("Client must be used within an async context manager")
+        return await self._request(
+            "DELETE",
+            path,
+            expected_codes,
+            params=params,
+        )
 
-        async with self._session.delete(
+    async def stream_get(
+        self,
+        path: str,
+        prefix: str = "results.item",
+        params: Optional[Dict[str, Any]] = None,
+        expected_codes: Collection[int] = _OK_GET,
+    ) -> AsyncIterator[Any]:
+        """Stream the items of a JSON response from a GET request.
+
+        When ijson is installed the body is parsed incrementally as it is
+        received, so only one item needs to be held in memory at a time.
+        Otherwise the body is decoded in full and the same items are yielded.
+
+        Example:
+            async for rule in client.stream_get("/rules", params={"limit": 100}):
+                ...
+
+        Args:
+            path: The API path (e.g., '/rules')
+            prefix: The ijson-style prefix of the items to yield (default: "results.item")
+            params: Optional query parameters
+            expected_codes: Status codes considered successful (default: {200})
+
+        Yields:
+            Each JSON value found at the prefix
+
+        Raises:
+            Exception: If the request fails or returns an unexpected status code
+        """
+        await self._ensure_session()
+
+        async with self._session.request(
+            "GET",
             self._build_url(path),
             headers=self._headers,
             params=params,
-            ssl=not os.getenv("PANTHER_ALLOW_INSECURE_INSTANCE"),
+            ssl=_SSL_VERIFY,
         ) as response:
             await self._validate_response(response, expected_codes)
-            return await response.json(), response.status
+            if ijson is not None:
+                async for item in ijson.items_async(response.content, prefix):
+                    yield item
+            else:
+                data = await response.json(loads=_json_loads)
+                for item in _iter_json_prefix(data, prefix.split(".")):
+                    yield item
+
+    async def gather_get(
+        self,
+        paths: Sequence[str],
+        params: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        expected_codes: Collection[int] = _OK_GET,
+    ) -> List[Tuple[Dict[str, Any], int]]:
+        """Make several GET requests to the Panther API concurrently.
+
+        Use this instead of awaiting get() in a loop when the requests are
+        independent of each other. All requests share the client session.
+
+        Example:
+            results = await client.gather_get(
+                [f"/rules/{rule_id}" for rule_id in rule_ids],
+                expected_codes=[200, 404],
+            )
+
+        Args:
+            paths: The API paths to fetch
+            params: Optional query parameters for each path, in the same order
+            expected_codes: Status codes considered successful (default: {200})
+
+        Returns:
+            List[Tuple[Dict[str, Any], int]]: The response and status code for
+            each path, in the same order as paths
+
+        Raises:
+            Exception: If any request fails or returns an unexpected status code
+        """
+        if params is None:
+            params = [None] * len(paths)
+        return await asyncio.gather(
+            *(
+                self.get(path, params=path_params, expected_codes=expected_codes)
+                for path, path_params in zip(paths, params, strict=True)
+            )
+        )
+
+    async def gather_post(
+        self,
+        path: str,
+        json_data: Sequence[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+        expected_codes: Collection[int] = _OK_WRITE,
+    ) -> List[Tuple[Dict[str, Any], int]]:
+        """Make several POST requests to the same API path concurrently.
+
+        Args:
+            path: The API path (e.g., '/alert-comments')
+            json_data: The JSON body for each request
+            params: Optional query parameters sent with every request
+            expected_codes: Status codes considered successful (default: {200, 201})
+
+        Returns:
+            List[Tuple[Dict[str, Any], int]]: The response and status code for
+            each request body, in the same order as json_data
+
+        Raises:
+            Exception: If any request fails or returns an unexpected status code
+        """
+        return await asyncio.gather(
+            *(
+                self.post(
+                    path, json_data=body, params=params, expected_codes=expected_codes
+                )
+                for body in json_data
+            )
+        )
 
 
 _rest_client: Optional[PantherRestClient] = None
@@ -504,7 +1129,9 @@ def get_rest_client() -> PantherRestClient:
     """Get the singleton instance of PantherRestClient.
 
     This function lazily instantiates the client on first call
-    and returns the same instance for subsequent calls.
+    and returns the same instance for subsequent calls. The client opens its
+    session on first request, so it can be used directly or as an async
+    context manager.
 
     Returns:
         PantherRestClient: The singleton instance of the REST client
@@ -0,0 +1,166 @@
+"""
+Batching helpers for coalescing concurrent Panther API calls.
+
+Agents often fire many single-alert updates back to back. AsyncBatcher collects
+the IDs submitted under the same key within a short window and sends them to
+Panther in a single request, handing each caller back only its own results.
+"""
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+logger = logging.getLogger("mcp-panther")
+
+BatchExecutor = Callable[[List[Hashable]], Awaitable[List[Dict[str, Any]]]]
+
+
+class _PendingBatch:
+    """IDs and waiting callers collected for one batch key."""
+
+    __slots__ = ("execute", "ids", "seen", "waiters", "flushed")
+
+    def __init__(self, execute: BatchExecutor):
+        self.execute = execute
+        self.ids: List[Hashable] = []
+        self.seen: Set[Hashable] = set()
+        self.waiters: List[Tuple[Dict[Hashable, None], asyncio.Future]] = []
+        self.flushed = False
+
+
+class AsyncBatcher:
+    """Coalesce concurrent ID-based requests that share a key into one call.
+
+    The first submission for a key opens a batch that is flushed after `delay`
+    seconds, or as soon as it holds `max_size` IDs; a submission that would
+    overflow it continues in a new batch. The executor receives the
+    de-duplicated union of IDs and returns a list of objects with an "id" field,
+    which are routed back to the callers that asked for them. If a merged call
+    fails, each caller's IDs are retried on their own so one bad request only
+    fails its own caller.
+    """
+
+    def __init__(self, delay: float = 0.005, max_size: int = 100):
+        self.delay = delay
+        self.max_size = max_size
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(
+        self, key: Hashable, ids: Sequence[Hashable], execute: BatchExecutor
+    ) -> List[Dict[str, Any]]:
+        """Queue IDs for the batch under `key` and wait for their results.
+
+        Args:
+            key: Requests with equal keys are merged, so it must capture every
+                argument of the call other than the IDs
+            ids: The IDs this caller wants processed
+            execute: Coroutine function called with the merged IDs when the
+                batch is flushed. Only the first caller's executor is used.
+
+        Returns:
+            The objects returned by the executor whose "id" is in `ids`
+        """
+        loop = asyncio.get_running_loop()
+        futures: List[asyncio.Future] = []
+        batch = None
+        wanted: Dict[Hashable, None] = {}
+
+        for item_id in dict.fromkeys(ids):
+            if batch is None:
+                batch = self._pending.get(key)
+                if batch is None:
+                    batch = self._pending[key] = _PendingBatch(execute)
+                    loop.call_later(self.delay, self._flush, key, batch)
+                wanted = {}
+
+            wanted[item_id] = None
+            if item_id not in batch.seen:
+                batch.seen.add(item_id)
+                batch.ids.append(item_id)
+
+            # Never let a batch grow past max_size; the rest of this caller's
+            # IDs go into the next batch
+            if len(batch.ids) >= self.max_size:
+                futures.append(self._wait(loop, batch, wanted))
+                self._flush(key, batch)
+                batch = None
+
+        if batch is not None:
+            futures.append(self._wait(loop, batch, wanted))
+
+        parts = await asyncio.gather(*futures)
+        return [item for part in parts for item in part]
+
+    @staticmethod
+    def _wait(
+        loop: asyncio.AbstractEventLoop,
+        batch: _PendingBatch,
+        wanted: Dict[Hashable, None],
+    ) -> asyncio.Future:
+        future = loop.create_future()
+        batch.waiters.append((wanted, future))
+        return future
+
+    def _flush(self, key: Hashable, batch: _PendingBatch) -> None:
+        if batch.flushed:
+            return
+        batch.flushed = True
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _PendingBatch) -> None:
+        logger.debug(
+            "Flushing batch of %d IDs for %d callers",
+            len(batch.ids),
+            len(batch.waiters),
+        )
+        try:
+            results = await batch.execute(batch.ids)
+        except Exception as e:
+            if len(batch.waiters) == 1:
+                _, future = batch.waiters[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            # One caller's bad ID must not fail everyone else's request, so
+            # retry each caller on its own and report errors individually
+            logger.debug("Batch failed, retrying %d callers", len(batch.waiters))
+            await asyncio.gather(
+                *(
+                    self._run_alone(batch.execute, ids, future)
+                    for ids, future in batch.waiters
+                )
+            )
+            return
+
+        for ids, future in batch.waiters:
+            if not future.done():
+                future.set_result([item for item in results if item.get("id") in ids])
+
+    @staticmethod
+    async def _run_alone(
+        execute: BatchExecutor, ids: Dict[Hashable, None], future: asyncio.Future
+    ) -> None:
+        try:
+            results = await execute(list(ids))
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result([item for item in results if item.get("id") in ids])
@@ -1,35 +1,45 @@
+import sys
 from enum import Enum
+from types import MappingProxyType
 from typing import Dict, List, Optional, Union
 
 
 class Permission(Enum):
-    """Panther permissions that can be required for tools."""
+    """Panther permissions that can be required for tools.
 
-    ALERT_MODIFY = "Manage Alerts"
-    ALERT_READ = "View Alerts"
-    DATA_ANALYTICS_READ = "Query Data Lake"
-    LOG_SOURCE_READ = "View Log Sources"
-    METRICS_READ = "Read Panther Metrics"
-    ORGANIZATION_API_TOKEN_READ = "Read API Token Info"
-    POLICY_READ = "View Policies"
-    RULE_MODIFY = "Manage Rules"
-    RULE_READ = "View Rules"
-    USER_READ = "View Users"
+    Values are interned so that permission titles compare by identity.
+    """
+
+    ALERT_MODIFY = sys.intern("Manage Alerts")
+    ALERT_READ = sys.intern("View Alerts")
+    DATA_ANALYTICS_READ = sys.intern("Query Data Lake")
+    LOG_SOURCE_READ = sys.intern("View Log Sources")
+    METRICS_READ = sys.intern("Read Panther Metrics")
+    ORGANIZATION_API_TOKEN_READ = sys.intern("Read API Token Info")
+    POLICY_READ = sys.intern("View Policies")
+    RULE_MODIFY = sys.intern("Manage Rules")
+    RULE_READ = sys.intern("View Rules")
+    USER_READ = sys.intern("View Users")
 
 
 # Mapping from raw values to enum values
-RAW_TO_TITLE = {
-    "AlertModify": Permission.ALERT_MODIFY,
-    "AlertRead": Permission.ALERT_READ,
-    "DataAnalyticsRead": Permission.DATA_ANALYTICS_READ,
-    "LogSourceRead": Permission.LOG_SOURCE_READ,
-    "OrganizationAPITokenRead": Permission.ORGANIZATION_API_TOKEN_READ,
-    "PolicyRead": Permission.POLICY_READ,
-    "RuleModify": Permission.RULE_MODIFY,
-    "RuleRead": Permission.RULE_READ,
-    "SummaryRead": Permission.METRICS_READ,  # Allows reading data & alert metrics
-    "UserRead": Permission.USER_READ,
-}
+RAW_TO_TITLE = MappingProxyType(
+    {
+        "AlertModify": Permission.ALERT_MODIFY,
+        "AlertRead": Permission.ALERT_READ,
+        "DataAnalyticsRead": Permission.DATA_ANALYTICS_READ,
+        "LogSourceRead": Permission.LOG_SOURCE_READ,
+        "OrganizationAPITokenRead": Permission.ORGANIZATION_API_TOKEN_READ,
+        "PolicyRead": Permission.POLICY_READ,
+        "RuleModify": Permission.RULE_MODIFY,
+        "RuleRead": Permission.RULE_READ,
+        "SummaryRead": Permission.METRICS_READ,  # Allows reading data & alert metrics
+        "UserRead": Permission.USER_READ,
+    }
+)
+
+# Mapping from enum values to their title strings
+_PERM_VALUES = MappingProxyType({p: p.value for p in Permission})
 
 
 def convert_permissions(permissions: List[str]) -> List[Permission]:
@@ -43,7 +53,15 @@ def convert_permissions(permissions: List[str]) -> List[Permission]:
     Returns:
         List of Permission enums with title values
     """
-    return [RAW_TO_TITLE[perm] for perm in permissions if perm in RAW_TO_TITLE]
+    return [perm for perm in map(RAW_TO_TITLE.get, permissions) if perm is not None]
+
+
+def _perm_values(permissions: List[Union[Permission, str]]) -> List[str]:
+    """Convert a list of permissions to their interned title strings."""
+    return [
+        _PERM_VALUES[p] if p.__class__ is Permission else sys.intern(p)
+        for p in permissions
+    ]
 
 
 def perms(
@@ -62,10 +80,10 @@ def perms(
     """
     result = {}
     if any_of is not None:
-        result["any_of"] = [p if isinstance(p, str) else p.value for p in any_of]
+        result["any_of"] = _perm_values(any_of)
 
     if all_of is not None:
-        result["all_of"] = [p if isinstance(p, str) else p.value for p in all_of]
+        result["all_of"] = _perm_values(all_of)
 
     return result
 
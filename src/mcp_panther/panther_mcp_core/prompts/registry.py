@@ -5,13 +5,15 @@ This module provides functions for registering prompt templates with the MCP ser
 """
 
 import logging
-from functools import wraps
-from typing import Callable, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger("mcp-panther")
 
-# Registry to store all prompt functions
-_prompt_registry: Set[Callable] = set()
+# Registry to store all prompt functions, in the order they were decorated
+_prompt_registry: List[Callable] = []
+
+# Sorted prompt names, computed on first lookup and reset whenever the registry changes
+_prompt_names: Optional[Tuple[str, ...]] = None
 
 
 def mcp_prompt(
@@ -50,19 +52,19 @@ def mcp_prompt(
     """
 
     def decorator(func: Callable) -> Callable:
+        global _prompt_names
+
         # Store metadata on the function
         func._mcp_prompt_metadata = {
             "name": name,
             "description": description,
             "tags": tags,
         }
-        _prompt_registry.add(func)
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+        if func not in _prompt_registry:
+            _prompt_registry.append(func)
+        _prompt_names = None
 
-        return wrapper
+        return func
 
     # Handle both @mcp_prompt and @mcp_prompt(...) cases
     if func is None:
@@ -77,20 +79,28 @@ def register_all_prompts(mcp_instance) -> None:
     Args:
         mcp_instance: The FastMCP instance to register prompts with
     """
-    logger.info(f"Registering {len(_prompt_registry)} prompts with MCP")
+    logger.info("Registering %d prompts with MCP", len(_prompt_registry))
+
+    # Prompts with the same metadata share one decorator; the common bare
+    # @mcp_prompt case needs only a single mcp_instance.prompt() call.
+    decorators: Dict[Tuple[Any, ...], Callable] = {}
 
     for prompt in _prompt_registry:
-        logger.debug(f"Registering prompt: {prompt.__name__}")
+        logger.debug("Registering prompt: %s", prompt.__name__)
 
         # Get prompt metadata if it exists
         metadata = getattr(prompt, "_mcp_prompt_metadata", {})
-
-        # Create prompt decorator with metadata
-        prompt_decorator = mcp_instance.prompt(
-            name=metadata.get("name"),
-            description=metadata.get("description"),
-            tags=metadata.get("tags"),
-        )
+        name = metadata.get("name")
+        description = metadata.get("description")
+        tags = metadata.get("tags")
+
+        key = (name, description, frozenset(tags) if tags else None)
+        prompt_decorator = decorators.get(key)
+        if prompt_decorator is None:
+            # Create prompt decorator with metadata
+            prompt_decorator = decorators[key] = mcp_instance.prompt(
+                name=name, description=description, tags=tags
+            )
 
         # Register the prompt
         prompt_decorator(prompt)
@@ -98,11 +108,14 @@ def register_all_prompts(mcp_instance) -> None:
     logger.info("All prompts registered successfully")
 
 
-def get_available_prompt_names() -> list[str]:
+def get_available_prompt_names() -> Tuple[str, ...]:
     """
-    Get a list of all registered prompt names.
+    Get the sorted names of all registered prompts.
 
     Returns:
-        A list of the names of all registered prompts
+        A tuple of the names of all registered prompts
     """
-    return sorted([prompt.__name__ for prompt in _prompt_registry])
+    global _prompt_names
+    if _prompt_names is None:
+        _prompt_names = tuple(sorted(prompt.__name__ for prompt in _prompt_registry))
+    return _prompt_names
@@ -1,28 +1,42 @@
+import functools
+from typing import FrozenSet
+
 from gql import gql
+from graphql import DocumentNode
 
 # Alert Queries
-GET_TODAYS_ALERTS_QUERY = gql("""
+# Selections for each field that can be requested from list_alerts, in query order
+ALERT_FIELD_SELECTIONS = {
+    "id": "id",
+    "title": "title",
+    "severity": "severity",
+    "status": "status",
+    "createdAt": "createdAt",
+    "type": "type",
+    "description": "description",
+    "reference": "reference",
+    "runbook": "runbook",
+    "firstEventOccurredAt": "firstEventOccurredAt",
+    "lastReceivedEventAt": "lastReceivedEventAt",
+    "origin": "origin { ... on Detection { id name } }",
+}
+
+
+# Alert fields shared by the alert list and alert detail queries
+ALERT_CORE_FIELDS = (
+    "\nfragment AlertCore on Alert {\n"
+    + "\n".join(f"    {selection}" for selection in ALERT_FIELD_SELECTIONS.values())
+    + "\n}\n"
+)
+
+GET_TODAYS_ALERTS_QUERY = gql(
+    ALERT_CORE_FIELDS
+    + """
 query FirstPageOfAllAlerts($input: AlertsInput!) {
     alerts(input: $input) {
         edges {
             node {
-                id
-                title
-                severity
-                status
-                createdAt
-                type
-                description
-                reference
-                runbook
-                firstEventOccurredAt
-                lastReceivedEventAt
-                origin {
-                    ... on Detection {
-                        id
-                        name
-                    }
-                }
+                ...AlertCore
             }
         }
         pageInfo {
@@ -33,32 +47,58 @@ query FirstPageOfAllAlerts($input: AlertsInput!) {
         }
     }
 }
-""")
+"""
+)
+
 
-GET_ALERT_BY_ID_QUERY = gql("""
+@functools.lru_cache(maxsize=32)
+def get_alerts_query_for_fields(fields: FrozenSet[str]) -> DocumentNode:
+    """Build an alerts list query that selects only the given alert fields.
+
+    Args:
+        fields: Keys of ALERT_FIELD_SELECTIONS to select on each alert
+
+    Returns:
+        DocumentNode: The parsed query, cached per set of fields
+    """
+    selection = "\n".join(
+        ALERT_FIELD_SELECTIONS[field]
+        for field in ALERT_FIELD_SELECTIONS
+        if field in fields
+    )
+    return gql(
+        """
+query FirstPageOfAllAlerts($input: AlertsInput!) {
+    alerts(input: $input) {
+        edges {
+            node {
+                %s
+            }
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+            hasPreviousPage
+            startCursor
+        }
+    }
+}
+"""
+        % selection
+    )
+
+
+GET_ALERT_BY_ID_QUERY = gql(
+    ALERT_CORE_FIELDS
+    + """
 query GetAlertById($id: ID!) {
     alert(id: $id) {
-        id
-        title
-        severity
-        status
-        createdAt
-        type
-        description
-        reference
-        runbook
-        firstEventOccurredAt
-        lastReceivedEventAt
+        ...AlertCore
         updatedAt
-        origin {
-            ... on Detection {
-                id
-                name
-            }
-        }
     }
 }
-""")
+"""
+)
 
 UPDATE_ALERT_STATUS_MUTATION = gql("""
 mutation UpdateAlertStatusById($input: UpdateAlertStatusByIdInput!) {
@@ -164,7 +204,13 @@ mutation ExecuteDataLakeQuery($input: ExecuteDataLakeQueryInput!) {
 """)
 
 GET_DATA_LAKE_QUERY = gql("""
-query GetDataLakeQuery($id: ID!, $root: Boolean = false) {
+query GetDataLakeQuery(
+    $id: ID!
+    $root: Boolean = false
+    $pageSize: Int = 999
+    $cursor: String
+    $includeResults: Boolean = true
+) {
     dataLakeQuery(id: $id, root: $root) {
         id
         status
@@ -172,7 +218,8 @@ query GetDataLakeQuery($id: ID!, $root: Boolean = false) {
         sql
         startedAt
         completedAt
-        results(input: { pageSize: 999 }) {
+        results(input: { pageSize: $pageSize, cursor: $cursor })
+            @include(if: $includeResults) {
             edges {
                 node
             }
@@ -227,23 +274,91 @@ query ListTables($databaseName: String!, $pageSize: Int, $cursor: String) {
 }
 """)
 
-GET_COLUMNS_FOR_TABLE_QUERY = gql("""
-query GetColumnDetails($databaseName: String!, $tableName: String!) {
-  dataLakeDatabaseTable(input: { databaseName: $databaseName, tableName: $tableName }) {
+
+@functools.lru_cache(maxsize=32)
+def get_tables_query_for_databases(database_count: int) -> DocumentNode:
+    """Build a query that fetches the first page of tables for several databases.
+
+    Each database is selected under the alias db0, db1, ... and its name is
+    passed in the variable of the same name.
+
+    Args:
+        database_count: Number of databases to select
+
+    Returns:
+        DocumentNode: The parsed query, cached per database count
+    """
+    aliases = [f"db{index}" for index in range(database_count)]
+    variables = "".join(f", ${alias}: String!" for alias in aliases)
+    selections = "\n".join(
+        """
+  %s: dataLakeDatabaseTables(input: { databaseName: $%s, pageSize: $pageSize }) {
+    edges {
+      node {
+        name
+        description
+        logType
+      }
+    }
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+  }"""
+        % (alias, alias)
+        for alias in aliases
+    )
+    return gql(
+        """
+query ListTablesForDatabases($pageSize: Int%s) {%s
+}
+"""
+        % (variables, selections)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def get_columns_query_for_tables(table_count: int) -> DocumentNode:
+    """Build a query that fetches the columns of several tables at once.
+
+    Each table is selected under the alias t0, t1, ... and identified by the
+    variables <alias>Database and <alias>Table. Table and column descriptions are
+    only selected when $includeDescriptions is true, its default.
+
+    Args:
+        table_count: Number of tables to select
+
+    Returns:
+        DocumentNode: The parsed query, cached per table count
+    """
+    aliases = [f"t{index}" for index in range(table_count)]
+    variables = ", ".join(
+        f"${alias}Database: String!, ${alias}Table: String!" for alias in aliases
+    )
+    selections = "\n".join(
+        """
+  %s: dataLakeDatabaseTable(input: { databaseName: $%sDatabase, tableName: $%sTable }) {
     name,
     displayName,
-    description,
+    description @include(if: $includeDescriptions),
     logType,
     columns {
       name,
       type,
-      description
+      description @include(if: $includeDescriptions)
     }
-  }
+  }"""
+        % (alias, alias, alias)
+        for alias in aliases
+    )
+    return gql(
+        """
+query GetColumnDetailsForTables($includeDescriptions: Boolean = true, %s) {%s
 }
-""")
+"""
+        % (variables, selections)
+    )
 
-# Add after ALL_DATABASE_ENTITIES_QUERY
 
 LIST_SCHEMAS_QUERY = gql("""
 query ListSchemas($input: SchemasInput!) {
@@ -2,6 +2,7 @@
 Resources for providing configuration information about the Panther MCP server.
 """
 
+import asyncio
 from typing import Any, Dict
 
 from ..client import get_panther_gql_endpoint, get_panther_rest_api_base
@@ -13,9 +14,12 @@ from .registry import get_available_resource_paths, mcp_resource
 @mcp_resource("config://panther")
 async def get_panther_config() -> Dict[str, Any]:
     """Get the Panther configuration."""
+    gql_api_url, rest_api_url = await asyncio.gather(
+        get_panther_gql_endpoint(), get_panther_rest_api_base()
+    )
     return {
-        "gql_api_url": await get_panther_gql_endpoint(),
-        "rest_api_url": await get_panther_rest_api_base(),
+        "gql_api_url": gql_api_url,
+        "rest_api_url": rest_api_url,
         "available_tools": get_available_tool_names(),
         "available_resources": get_available_resource_paths(),
         "available_prompts": get_available_prompt_names(),
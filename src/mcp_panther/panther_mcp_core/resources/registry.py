@@ -7,13 +7,15 @@ and can be registered with the MCP server using register_all_resources().
 """
 
 import logging
-from functools import wraps
-from typing import Callable, Dict, Optional, Set
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 logger = logging.getLogger("mcp-panther")
 
-# Registry to store all decorated resources
-_resource_registry: Dict[str, Callable] = {}
+# Registry to store all decorated resources and their metadata, keyed by URI
+_resource_registry: Dict[str, Tuple[Callable, Dict[str, Any]]] = {}
+
+# Sorted resource paths, computed on first lookup and reset whenever the registry changes
+_resource_paths: Optional[Tuple[str, ...]] = None
 
 
 def mcp_resource(
@@ -44,21 +46,21 @@ def mcp_resource(
     """
 
     def decorator(func: Callable) -> Callable:
-        # Store metadata on the function
-        func._mcp_resource_metadata = {
-            "uri": uri,
-            "name": name,
-            "description": description,
-            "mime_type": mime_type,
-            "tags": tags,
-        }
-        _resource_registry[uri] = func
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-
-        return wrapper
+        global _resource_paths
+
+        # Store the function alongside its metadata
+        _resource_registry[uri] = (
+            func,
+            {
+                "name": name,
+                "description": description,
+                "mime_type": mime_type,
+                "tags": tags,
+            },
+        )
+        _resource_paths = None
+
+        return func
 
     return decorator
 
@@ -70,33 +72,23 @@ def register_all_resources(mcp_instance) -> None:
     Args:
         mcp_instance: The FastMCP instance to register resources with
     """
-    logger.info(f"Registering {len(_resource_registry)} resources with MCP")
-
-    for uri, resource_func in _resource_registry.items():
-        logger.debug(f"Registering resource: {uri} -> {resource_func.__name__}")
-        # Get resource metadata if it exists
-        metadata = getattr(resource_func, "_mcp_resource_metadata", {})
-
-        # Create resource decorator with metadata
-        resource_decorator = mcp_instance.resource(
-            uri=metadata["uri"],
-            name=metadata.get("name"),
-            description=metadata.get("description"),
-            mime_type=metadata.get("mime_type"),
-            tags=metadata.get("tags"),
-        )
+    logger.info("Registering %d resources with MCP", len(_resource_registry))
 
-        # Register the resource
-        resource_decorator(resource_func)
+    for uri, (resource_func, metadata) in _resource_registry.items():
+        logger.debug("Registering resource: %s -> %s", uri, resource_func.__name__)
+        mcp_instance.resource(uri=uri, **metadata)(resource_func)
 
     logger.info("All resources registered successfully")
 
 
-def get_available_resource_paths() -> list[str]:
+def get_available_resource_paths() -> Tuple[str, ...]:
     """
-    Get a list of all registered resource paths.
+    Get the sorted paths of all registered resources.
 
     Returns:
-        A list of the paths of all registered resources
+        A tuple of the paths of all registered resources
     """
-    return sorted(_resource_registry.keys())
+    global _resource_paths
+    if _resource_paths is None:
+        _resource_paths = tuple(sorted(_resource_registry.keys()))
+    return _resource_paths
@@ -2,9 +2,13 @@
 Package for Panther MCP tools.
 
 This package contains all the tool functions available for Panther through MCP.
-All tool modules are imported here to ensure their decorators are processed.
+Tool modules are imported lazily on first attribute access; register_all_tools()
+calls load_all_tools() so that every @mcp_tool decorator is processed before
+the tools are registered with the server.
 """
 
+import importlib
+
 # Define all modules that should be available when importing this package
 __all__ = [
     "alerts",
@@ -18,15 +22,16 @@ __all__ = [
     "permissions",
 ]
 
-# Import all tool modules to ensure decorators are processed
-from . import (
-    alerts,
-    data_lake,
-    helpers,
-    metrics,
-    permissions,
-    rules,
-    schemas,
-    sources,
-    users,
-)
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def load_all_tools() -> None:
+    """Import every tool module so that its @mcp_tool decorators are processed."""
+    for name in __all__:
+        importlib.import_module(f".{name}", __name__)
@@ -2,27 +2,184 @@
 Tools for interacting with Panther alerts.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, List
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
+from ..async_cache import async_ttl_cache
 from ..client import (
-    _create_panther_client,
     _execute_query,
+    _get_gql_session,
     _get_today_date_range,
     get_rest_client,
 )
+from ..client_batch import AsyncBatcher
 from ..permissions import Permission, all_perms
 from ..queries import (
     ADD_ALERT_COMMENT_MUTATION,
+    ALERT_FIELD_SELECTIONS,
     GET_ALERT_BY_ID_QUERY,
     GET_TODAYS_ALERTS_QUERY,
     UPDATE_ALERT_STATUS_MUTATION,
     UPDATE_ALERTS_ASSIGNEE_BY_ID_MUTATION,
+    get_alerts_query_for_fields,
 )
 from .registry import mcp_tool
 
 logger = logging.getLogger("mcp-panther")
 
+# Default filters and accepted values for the alert tools
+_DEFAULT_SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+_DEFAULT_STATUSES = ("OPEN", "TRIAGED", "RESOLVED", "CLOSED")
+_VALID_STATUSES = frozenset(_DEFAULT_STATUSES)
+_VALID_ALERT_TYPES = frozenset({"ALERT", "DETECTION_ERROR", "SYSTEM_ERROR"})
+_VALID_SUBTYPES = {
+    "ALERT": frozenset({"POLICY", "RULE", "SCHEDULED_RULE"}),
+    "DETECTION_ERROR": frozenset({"RULE_ERROR", "SCHEDULED_RULE_ERROR"}),
+    "SYSTEM_ERROR": frozenset(),
+}
+
+# Filter values that mean "not set"; event counts of 0 are real filters
+_UNSET = (None, "", [])
+# Alert lookups report a missing alert as a 404 rather than an error
+_OK_OR_NOT_FOUND = frozenset({200, 404})
+
+# Seconds that alert reads are served from memory before hitting Panther again
+ALERT_CACHE_TTL_SECONDS = 15
+
+
+def _is_success(result: Dict[str, Any]) -> bool:
+    return result.get("success", False)
+
+
+class _ListAlertsInput(BaseModel):
+    """The list_alerts arguments that are checked before any request is sent."""
+
+    model_config = ConfigDict(frozen=True)
+
+    page_size: int
+    alert_type: str
+    subtypes: Optional[List[str]] = None
+    cursor: Optional[str] = None
+    fields: Optional[List[str]] = None
+
+    @field_validator("page_size")
+    @classmethod
+    def _check_page_size(cls, page_size: int) -> int:
+        if page_size < 1:
+            raise ValueError("page_size must be greater than 0")
+        if page_size > 50:
+            logger.warning(
+                "page_size %s exceeds maximum of 50, using 50 instead", page_size
+            )
+            return 50
+        return page_size
+
+    @field_validator("alert_type")
+    @classmethod
+    def _check_alert_type(cls, alert_type: str) -> str:
+        if alert_type not in _VALID_ALERT_TYPES:
+            raise ValueError(f"alert_type must be one of {sorted(_VALID_ALERT_TYPES)}")
+        return alert_type
+
+    @field_validator("cursor", mode="before")
+    @classmethod
+    def _check_cursor(cls, cursor: Any) -> Any:
+        if cursor and not isinstance(cursor, str):
+            raise ValueError(
+                "Cursor must be a string value from previous response's endCursor"
+            )
+        return cursor
+
+    @field_validator("fields")
+    @classmethod
+    def _check_fields(cls, fields: Optional[List[str]]) -> Optional[List[str]]:
+        if fields:
+            invalid_fields = set(fields) - ALERT_FIELD_SELECTIONS.keys()
+            if invalid_fields:
+                raise ValueError(
+                    f"Invalid fields {sorted(invalid_fields)}. "
+                    f"Valid fields are: {list(ALERT_FIELD_SELECTIONS)}"
+                )
+        return fields
+
+    @model_validator(mode="after")
+    def _check_subtypes(self) -> "_ListAlertsInput":
+        if self.subtypes:
+            if self.alert_type == "SYSTEM_ERROR":
+                raise ValueError(
+                    "subtypes are not allowed when alert_type is SYSTEM_ERROR"
+                )
+
+            allowed_subtypes = _VALID_SUBTYPES[self.alert_type]
+            invalid_subtypes = set(self.subtypes) - allowed_subtypes
+            if invalid_subtypes:
+                raise ValueError(
+                    f"Invalid subtypes {sorted(invalid_subtypes)} for alert_type={self.alert_type}. "
+                    f"Valid subtypes are: {sorted(allowed_subtypes)}"
+                )
+        return self
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Join the messages of a ValidationError into one readable line."""
+    return "; ".join(
+        detail["msg"].removeprefix("Value error, ") for detail in error.errors()
+    )
+
+
+# Coalesces alert updates that share a status or assignee and arrive within a
+# few milliseconds of each other, as back-to-back tool calls do
+_alert_update_batcher = AsyncBatcher()
+
+
+async def _execute_alert_status_update(
+    alert_ids: List[str], status: str
+) -> List[Dict[str, Any]]:
+    """Run one status mutation for a batch of alert IDs."""
+    variables = {
+        "input": {
+            "ids": alert_ids,
+            "status": status,
+        }
+    }
+
+    result = await _execute_query(UPDATE_ALERT_STATUS_MUTATION, variables)
+
+    if not result or "updateAlertStatusById" not in result:
+        raise Exception("Failed to update alert status")
+
+    return result["updateAlertStatusById"]["alerts"]
+
+
+async def _execute_alert_assignee_update(
+    alert_ids: List[str], assignee_id: str
+) -> List[Dict[str, Any]]:
+    """Run one assignee mutation for a batch of alert IDs."""
+    variables = {
+        "input": {
+            "ids": alert_ids,
+            "assigneeId": assignee_id,
+        }
+    }
+
+    result = await _execute_query(UPDATE_ALERTS_ASSIGNEE_BY_ID_MUTATION, variables)
+
+    if not result or "updateAlertsAssigneeById" not in result:
+        raise Exception("Failed to update alert assignee")
+
+    return result["updateAlertsAssigneeById"]["alerts"]
+
 
 @mcp_tool(
     annotations={
@@ -32,8 +189,8 @@ logger = logging.getLogger("mcp-panther")
 async def list_alerts(
     start_date: str | None = None,
     end_date: str | None = None,
-    severities: List[str] = ["CRITICAL", "HIGH", "MEDIUM", "LOW"],
-    statuses: List[str] = ["OPEN", "TRIAGED", "RESOLVED", "CLOSED"],
+    severities: List[str] | None = None,
+    statuses: List[str] | None = None,
     cursor: str | None = None,
     detection_id: str | None = None,
     event_count_max: int | None = None,
@@ -45,6 +202,7 @@ async def list_alerts(
     resource_types: List[str] | None = None,
     subtypes: List[str] | None = None,
     alert_type: str = "ALERT",  # Defaults to ALERT per schema
+    fields: List[str] | None = None,
 ) -> Dict[str, Any]:
     """List alerts from Panther with comprehensive filtering options
 
@@ -70,44 +228,37 @@ async def list_alerts(
             - "ALERT": Regular detection alerts
             - "DETECTION_ERROR": Alerts from detection errors
             - "SYSTEM_ERROR": System error alerts
+        fields: Optional list of alert fields to return, to keep responses small. "id" is
+            always included. Defaults to all fields. Valid fields: id, title, severity, status,
+            createdAt, type, description, reference, runbook, firstEventOccurredAt,
+            lastReceivedEventAt, origin
     """
     logger.info("Fetching alerts from Panther")
 
-    try:
-        client = await _create_panther_client()
+    if severities is None:
+        severities = list(_DEFAULT_SEVERITIES)
+    if statuses is None:
+        statuses = list(_DEFAULT_STATUSES)
 
-        # Validate page size
-        if page_size < 1:
-            raise ValueError("page_size must be greater than 0")
-        if page_size > 50:
-            logger.warning(
-                f"page_size {page_size} exceeds maximum of 50, using 50 instead"
+    try:
+        # Validate the arguments that do not depend on the API in one pass
+        try:
+            params = _ListAlertsInput(
+                page_size=page_size,
+                alert_type=alert_type,
+                subtypes=subtypes,
+                cursor=cursor,
+                fields=fields,
             )
-            page_size = 50
-
-        # Validate alert_type and subtypes combination
-        valid_alert_types = ["ALERT", "DETECTION_ERROR", "SYSTEM_ERROR"]
-        if alert_type not in valid_alert_types:
-            raise ValueError(f"alert_type must be one of {valid_alert_types}")
-
-        if subtypes:
-            valid_subtypes = {
-                "ALERT": ["POLICY", "RULE", "SCHEDULED_RULE"],
-                "DETECTION_ERROR": ["RULE_ERROR", "SCHEDULED_RULE_ERROR"],
-                "SYSTEM_ERROR": [],
-            }
-            if alert_type == "SYSTEM_ERROR":
-                raise ValueError(
-                    "subtypes are not allowed when alert_type is SYSTEM_ERROR"
-                )
+        except ValidationError as e:
+            raise ValueError(_validation_message(e)) from e
+        page_size = params.page_size
 
-            allowed_subtypes = valid_subtypes[alert_type]
-            invalid_subtypes = [st for st in subtypes if st not in allowed_subtypes]
-            if invalid_subtypes:
-                raise ValueError(
-                    f"Invalid subtypes {invalid_subtypes} for alert_type={alert_type}. "
-                    f"Valid subtypes are: {allowed_subtypes}"
-                )
+        # Only select the requested fields when the caller narrowed them down
+        if fields:
+            query = get_alerts_query_for_fields(frozenset(fields) | {"id"})
+        else:
+            query = GET_TODAYS_ALERTS_QUERY
 
         # Prepare base input variables
         variables = {
@@ -122,76 +273,48 @@ async def list_alerts(
         # Handle the required filter: either detectionId OR date range
         if detection_id:
             variables["input"]["detectionId"] = detection_id
-            logger.info(f"Filtering by detection ID: {detection_id}")
+            logger.info("Filtering by detection ID: %s", detection_id)
         else:
             # If no detection_id, we must have a date range
             # TODO(jn): Add support for relative date ranges
             if not start_date or not end_date:
                 start_date, end_date = _get_today_date_range()
                 logger.info(
-                    f"No detection ID and missing date range, using last 24 hours: {start_date} to {end_date}"
+                    "No detection ID and missing date range, using last 24 hours: %s to %s",
+                    start_date,
+                    end_date,
                 )
             else:
-                logger.info(f"Using provided date range: {start_date} to {end_date}")
+                logger.info("Using provided date range: %s to %s", start_date, end_date)
 
             variables["input"]["createdAtAfter"] = start_date
             variables["input"]["createdAtBefore"] = end_date
 
         # Add optional filters
-        if cursor:
-            if not isinstance(cursor, str):
-                raise ValueError(
-                    "Cursor must be a string value from previous response's endCursor"
-                )
-            variables["input"]["cursor"] = cursor
-            logger.info(f"Using cursor for pagination: {cursor}")
-
-        if severities:
-            variables["input"]["severities"] = severities
-            logger.info(f"Filtering by severities: {severities}")
-
-        if statuses:
-            variables["input"]["statuses"] = statuses
-            logger.info(f"Filtering by statuses: {statuses}")
-
-        if event_count_max is not None:
-            variables["input"]["eventCountMax"] = event_count_max
-            logger.info(f"Filtering by max event count: {event_count_max}")
-
-        if event_count_min is not None:
-            variables["input"]["eventCountMin"] = event_count_min
-            logger.info(f"Filtering by min event count: {event_count_min}")
-
-        if log_sources:
-            variables["input"]["logSources"] = log_sources
-            logger.info(f"Filtering by log sources: {log_sources}")
-
-        if log_types:
-            variables["input"]["logTypes"] = log_types
-            logger.info(f"Filtering by log types: {log_types}")
-
-        if name_contains:
-            variables["input"]["nameContains"] = name_contains
-            logger.info(f"Filtering by name contains: {name_contains}")
-
-        if resource_types:
-            variables["input"]["resourceTypes"] = resource_types
-            logger.info(f"Filtering by resource types: {resource_types}")
+        filters = {
+            "cursor": cursor,
+            "severities": severities,
+            "statuses": statuses,
+            "eventCountMax": event_count_max,
+            "eventCountMin": event_count_min,
+            "logSources": log_sources,
+            "logTypes": log_types,
+            "nameContains": name_contains,
+            "resourceTypes": resource_types,
+            "subtypes": subtypes,
+        }
+        variables["input"].update(
+            {key: value for key, value in filters.items() if value not in _UNSET}
+        )
 
-        if subtypes:
-            variables["input"]["subtypes"] = subtypes
-            logger.info(f"Filtering by subtypes: {subtypes}")
+        logger.debug("Query variables: %s", variables)
 
-        logger.debug(f"Query variables: {variables}")
-
-        # Execute the query asynchronously
-        async with client as session:
-            result = await session.execute(
-                GET_TODAYS_ALERTS_QUERY, variable_values=variables
-            )
+        # Execute the query on the shared GraphQL session
+        session = await _get_gql_session()
+        result = await session.execute(query, variable_values=variables)
 
         # Log the raw result for debugging
-        logger.debug(f"Raw query result: {result}")
+        logger.debug("Raw query result: %s", result)
 
         # Process results
         alerts_data = result.get("alerts", {})
@@ -199,9 +322,9 @@ async def list_alerts(
         page_info = alerts_data.get("pageInfo", {})
 
         # Extract alerts from edges
-        alerts = [edge["node"] for edge in alert_edges]
+        alerts = list(map(itemgetter("node"), alert_edges))
 
-        logger.info(f"Successfully retrieved {len(alerts)} alerts")
+        logger.info("Successfully retrieved %d alerts", len(alerts))
 
         # Format the response
         return {
@@ -214,7 +337,7 @@ async def list_alerts(
             "start_cursor": page_info.get("startCursor"),
         }
     except Exception as e:
-        logger.error(f"Failed to fetch alerts: {str(e)}")
+        logger.error("Failed to fetch alerts: %s", e)
         return {"success": False, "message": f"Failed to fetch alerts: {str(e)}"}
 
 
@@ -223,34 +346,31 @@ async def list_alerts(
         "permissions": all_perms(Permission.ALERT_READ),
     }
 )
+@async_ttl_cache(ttl=ALERT_CACHE_TTL_SECONDS, cache_if=_is_success)
 async def get_alert_by_id(alert_id: str) -> Dict[str, Any]:
     """Get detailed information about a specific Panther alert by ID"""
-    logger.info(f"Fetching alert details for ID: {alert_id}")
+    logger.info("Fetching alert details for ID: %s", alert_id)
     try:
-        client = await _create_panther_client()
-
         # Prepare input variables
         variables = {"id": alert_id}
 
-        # Execute the query asynchronously
-        async with client as session:
-            result = await session.execute(
-                GET_ALERT_BY_ID_QUERY, variable_values=variables
-            )
+        # Execute the query on the shared GraphQL session
+        session = await _get_gql_session()
+        result = await session.execute(GET_ALERT_BY_ID_QUERY, variable_values=variables)
 
         # Get alert data
         alert_data = result.get("alert", {})
 
         if not alert_data:
-            logger.warning(f"No alert found with ID: {alert_id}")
+            logger.warning("No alert found with ID: %s", alert_id)
             return {"success": False, "message": f"No alert found with ID: {alert_id}"}
 
-        logger.info(f"Successfully retrieved alert details for ID: {alert_id}")
+        logger.info("Successfully retrieved alert details for ID: %s", alert_id)
 
         # Format the response
         return {"success": True, "alert": alert_data}
     except Exception as e:
-        logger.error(f"Failed to fetch alert details: {str(e)}")
+        logger.error("Failed to fetch alert details: %s", e)
         return {"success": False, "message": f"Failed to fetch alert details: {str(e)}"}
 
 
@@ -259,6 +379,7 @@ async def get_alert_by_id(alert_id: str) -> Dict[str, Any]:
         "permissions": all_perms(Permission.ALERT_READ),
     }
 )
+@async_ttl_cache(ttl=ALERT_CACHE_TTL_SECONDS, cache_if=_is_success)
 async def list_alert_comments(
     alert_id: str,
     limit: int = 25,  # , cursor: str = None
@@ -280,7 +401,7 @@ async def list_alert_comments(
             - format: The format of the comment (HTML or PLAIN_TEXT or JSON_SCHEMA)
         - message: Error message if unsuccessful
     """
-    logger.info(f"Fetching comments for alert ID: {alert_id}")
+    logger.info("Fetching comments for alert ID: %s", alert_id)
     try:
         params = {"alert-id": alert_id, "limit": limit}
         async with get_rest_client() as client:
@@ -291,7 +412,9 @@ async def list_alert_comments(
             )
 
         if status == 400:
-            logger.error(f"Bad request when fetching comments for alert ID: {alert_id}")
+            logger.error(
+                "Bad request when fetching comments for alert ID: %s", alert_id
+            )
             return {
                 "success": False,
                 "message": f"Bad request when fetching comments for alert ID: {alert_id}",
@@ -300,7 +423,9 @@ async def list_alert_comments(
         comments = result.get("results", [])
 
         logger.info(
-            f"Successfully retrieved {len(comments)} comments for alert ID: {alert_id}"
+            "Successfully retrieved %d comments for alert ID: %s",
+            len(comments),
+            alert_id,
         )
 
         return {
@@ -309,7 +434,7 @@ async def list_alert_comments(
             "total_comments": len(comments),
         }
     except Exception as e:
-        logger.error(f"Failed to fetch alert comments: {str(e)}")
+        logger.error("Failed to fetch alert comments: %s", e)
         return {
             "success": False,
             "message": f"Failed to fetch alert comments: {str(e)}",
@@ -348,32 +473,25 @@ async def update_alert_status(alert_ids: List[str], status: str) -> Dict[str, An
         # Update multiple alerts
         result = await update_alert_status(["alert-123", "alert-456"], "RESOLVED")
     """
-    logger.info(f"Updating status for alerts {alert_ids} to {status}")
+    logger.info("Updating status for alerts %s to %s", alert_ids, status)
 
     try:
         # Validate status
-        valid_statuses = ["OPEN", "TRIAGED", "RESOLVED", "CLOSED"]
-        if status not in valid_statuses:
-            raise ValueError(f"Status must be one of {valid_statuses}")
-
-        # Prepare variables
-        variables = {
-            "input": {
-                "ids": alert_ids,
-                "status": status,
-            }
-        }
-
-        # Execute mutation
-        result = await _execute_query(UPDATE_ALERT_STATUS_MUTATION, variables)
-
-        if not result or "updateAlertStatusById" not in result:
-            raise Exception("Failed to update alert status")
+        if status not in _VALID_STATUSES:
+            raise ValueError(f"Status must be one of {list(_DEFAULT_STATUSES)}")
+
+        # Concurrent updates to the same status are sent as one mutation
+        alerts_data = await _alert_update_batcher.submit(
+            ("status", status),
+            alert_ids,
+            functools.partial(_execute_alert_status_update, status=status),
+        )
 
-        alerts_data = result["updateAlertStatusById"]["alerts"]
+        for alert_id in alert_ids:
+            get_alert_by_id.cache_invalidate(alert_id)
 
         logger.info(
-            f"Successfully updated {len(alerts_data)} alerts to status {status}"
+            "Successfully updated %d alerts to status %s", len(alerts_data), status
         )
 
         return {
@@ -382,7 +500,7 @@ async def update_alert_status(alert_ids: List[str], status: str) -> Dict[str, An
         }
 
     except Exception as e:
-        logger.error(f"Failed to update alert status: {str(e)}")
+        logger.error("Failed to update alert status: %s", e)
         return {
             "success": False,
             "message": f"Failed to update alert status: {str(e)}",
@@ -407,7 +525,7 @@ async def add_alert_comment(alert_id: str, comment: str) -> Dict[str, Any]:
         - comment: Created comment information if successful
         - message: Error message if unsuccessful
     """
-    logger.info(f"Adding comment to alert {alert_id}")
+    logger.info("Adding comment to alert %s", alert_id)
 
     try:
         # Prepare variables
@@ -425,8 +543,9 @@ async def add_alert_comment(alert_id: str, comment: str) -> Dict[str, Any]:
             raise Exception("Failed to add alert comment")
 
         comment_data = result["createAlertComment"]["comment"]
+        list_alert_comments.cache_invalidate(alert_id)
 
-        logger.info(f"Successfully added comment to alert {alert_id}")
+        logger.info("Successfully added comment to alert %s", alert_id)
 
         return {
             "success": True,
@@ -434,7 +553,7 @@ async def add_alert_comment(alert_id: str, comment: str) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Failed to add alert comment: {str(e)}")
+        logger.error("Failed to add alert comment: %s", e)
         return {
             "success": False,
             "message": f"Failed to add alert comment: {str(e)}",
@@ -461,26 +580,20 @@ async def update_alert_assignee_by_id(
         - alerts: List of updated alerts if successful
         - message: Error message if unsuccessful
     """
-    logger.info(f"Updating assignee for alerts {alert_ids} to user {assignee_id}")
+    logger.info("Updating assignee for alerts %s to user %s", alert_ids, assignee_id)
 
     try:
-        # Prepare variables
-        variables = {
-            "input": {
-                "ids": alert_ids,
-                "assigneeId": assignee_id,
-            }
-        }
-
-        # Execute mutation
-        result = await _execute_query(UPDATE_ALERTS_ASSIGNEE_BY_ID_MUTATION, variables)
-
-        if not result or "updateAlertsAssigneeById" not in result:
-            raise Exception("Failed to update alert assignee")
+        # Concurrent updates to the same assignee are sent as one mutation
+        alerts_data = await _alert_update_batcher.submit(
+            ("assignee", assignee_id),
+            alert_ids,
+            functools.partial(_execute_alert_assignee_update, assignee_id=assignee_id),
+        )
 
-        alerts_data = result["updateAlertsAssigneeById"]["alerts"]
+        for alert_id in alert_ids:
+            get_alert_by_id.cache_invalidate(alert_id)
 
-        logger.info(f"Successfully updated assignee for alerts {alert_ids}")
+        logger.info("Successfully updated assignee for alerts %s", alert_ids)
 
         return {
             "success": True,
@@ -488,7 +601,7 @@ async def update_alert_assignee_by_id(
         }
 
     except Exception as e:
-        logger.error(f"Failed to update alert assignee: {str(e)}")
+        logger.error("Failed to update alert assignee: %s", e)
         return {
             "success": False,
             "message": f"Failed to update alert assignee: {str(e)}",
@@ -517,7 +630,7 @@ async def get_alert_events(alert_id: str, limit: int = 10) -> Dict[str, Any]:
         - events: List of most recent events if successful
         - message: Error message if unsuccessful
     """
-    logger.info(f"Fetching events for alert ID: {alert_id}")
+    logger.info("Fetching events for alert ID: %s", alert_id)
     max_limit = 10
 
     try:
@@ -525,7 +638,10 @@ async def get_alert_events(alert_id: str, limit: int = 10) -> Dict[str, Any]:
             raise ValueError("limit must be greater than 0")
         if limit > max_limit:
             logger.warning(
-                f"limit {limit} exceeds maximum of {max_limit}, using {max_limit} instead"
+                "limit %s exceeds maximum of %s, using %s instead",
+                limit,
+                max_limit,
+                max_limit,
             )
             limit = max_limit
 
@@ -533,11 +649,13 @@ async def get_alert_events(alert_id: str, limit: int = 10) -> Dict[str, Any]:
 
         async with get_rest_client() as client:
             result, status = await client.get(
-                f"/alerts/{alert_id}/events", params=params, expected_codes=[200, 404]
+                f"/alerts/{alert_id}/events",
+                params=params,
+                expected_codes=_OK_OR_NOT_FOUND,
             )
 
             if status == 404:
-                logger.warning(f"No alert found with ID: {alert_id}")
+                logger.warning("No alert found with ID: %s", alert_id)
                 return {
                     "success": False,
                     "message": f"No alert found with ID: {alert_id}",
@@ -546,10 +664,113 @@ async def get_alert_events(alert_id: str, limit: int = 10) -> Dict[str, Any]:
         events = result.get("results", [])
 
         logger.info(
-            f"Successfully retrieved {len(events)} events for alert ID: {alert_id}"
+            "Successfully retrieved %d events for alert ID: %s", len(events), alert_id
         )
 
         return {"success": True, "events": events, "total_events": len(events)}
     except Exception as e:
-        logger.error(f"Failed to fetch alert events: {str(e)}")
+        logger.error("Failed to fetch alert events: %s", e)
         return {"success": False, "message": f"Failed to fetch alert events: {str(e)}"}
+
+
+@mcp_tool(
+    annotations={
+        "permissions": all_perms(Permission.ALERT_READ),
+    }
+)
+async def list_alerts_with_events(
+    start_date: str | None = None,
+    end_date: str | None = None,
+    severities: List[str] | None = None,
+    statuses: List[str] | None = None,
+    cursor: str | None = None,
+    detection_id: str | None = None,
+    page_size: int = 25,
+    alert_type: str = "ALERT",
+    events_per_alert: int = 10,
+    max_concurrency: int = 10,
+) -> Dict[str, Any]:
+    """List alerts from Panther together with a sampling of each alert's events.
+
+    The events for every alert on the page are fetched concurrently, which is much
+    faster than calling get_alert_events once per alert.
+
+    Args:
+        start_date: Optional start date in ISO 8601 format (e.g. "2024-03-20T00:00:00Z")
+        end_date: Optional end date in ISO 8601 format (e.g. "2024-03-21T00:00:00Z")
+        severities: Optional list of severities to filter by (e.g. ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"])
+        statuses: Optional list of statuses to filter by (e.g. ["OPEN", "TRIAGED", "RESOLVED", "CLOSED"])
+        cursor: Optional cursor for pagination from a previous query
+        detection_id: Optional detection ID to filter alerts by. If provided, date range is not required.
+        page_size: Number of alerts per page (default: 25, maximum: 50)
+        alert_type: Type of alerts to return (default: "ALERT")
+        events_per_alert: Maximum number of events to return per alert (default: 10, maximum: 10)
+        max_concurrency: Maximum number of event requests in flight at once (default: 10)
+
+    Returns:
+        Dict containing the same fields as list_alerts, where each alert also has:
+        - events: List of events for the alert (empty if the alert has none)
+    """
+    logger.info("Fetching alerts with events from Panther")
+    max_limit = 10
+
+    try:
+        if events_per_alert < 1:
+            raise ValueError("events_per_alert must be greater than 0")
+        if events_per_alert > max_limit:
+            logger.warning(
+                "events_per_alert %d exceeds maximum of %d, using %d instead",
+                events_per_alert,
+                max_limit,
+                max_limit,
+            )
+            events_per_alert = max_limit
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+
+        alerts_result = await list_alerts(
+            start_date=start_date,
+            end_date=end_date,
+            severities=severities,
+            statuses=statuses,
+            cursor=cursor,
+            detection_id=detection_id,
+            page_size=page_size,
+            alert_type=alert_type,
+        )
+        if not alerts_result["success"]:
+            return alerts_result
+
+        alerts = alerts_result["alerts"]
+        params = {"limit": events_per_alert}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # One shared REST session for every request; the semaphore caps fan-out
+        async with get_rest_client() as client:
+
+            async def fetch_events(alert_id: str):
+                async with semaphore:
+                    return await client.get(
+                        f"/alerts/{alert_id}/events",
+                        params=params,
+                        expected_codes=_OK_OR_NOT_FOUND,
+                    )
+
+            responses = await asyncio.gather(
+                *(fetch_events(alert["id"]) for alert in alerts)
+            )
+
+        alerts_with_events = [
+            {**alert, "events": result.get("results", []) if status == 200 else []}
+            for alert, (result, status) in zip(alerts, responses)
+        ]
+
+        logger.info("Successfully retrieved events for %d alerts", len(alerts))
+
+        return {**alerts_result, "alerts": alerts_with_events}
+    except Exception as e:
+        logger.error("Failed to fetch alerts with events: %s", e)
+        return {
+            "success": False,
+            "message": f"Failed to fetch alerts with events: {str(e)}",
+        }
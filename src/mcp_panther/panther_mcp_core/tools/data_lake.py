@@ -2,26 +2,143 @@
 Tools for interacting with Panther's data lake.
 """
 
+import asyncio
+import functools
 import logging
 import re
-from typing import Annotated, Any, Dict, List, Optional
+import time
+from operator import itemgetter
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
 import anyascii
+from gql.client import AsyncClientSession
 from pydantic import Field
 
-from ..client import _create_panther_client, _get_today_date_range
+from ..async_cache import async_ttl_cache, single_flight
+from ..client import RawJSON, _get_gql_session, _get_today_date_range
+from ..client_batch import AsyncBatcher
 from ..permissions import Permission, all_perms
 from ..queries import (
     EXECUTE_DATA_LAKE_QUERY,
-    GET_COLUMNS_FOR_TABLE_QUERY,
     GET_DATA_LAKE_QUERY,
     LIST_DATABASES_QUERY,
     LIST_TABLES_QUERY,
+    get_columns_query_for_tables,
+    get_tables_query_for_databases,
 )
 from .registry import mcp_tool
 
 logger = logging.getLogger("mcp-panther")
 
+# Database queried when the caller does not name one
+DEFAULT_DATABASE = "panther_logs.public"
+
+# Delays between status checks while waiting for a data lake query to finish
+QUERY_POLL_INITIAL_DELAY_SECONDS = 0.5
+QUERY_POLL_MAX_DELAY_SECONDS = 2
+
+# Database and table schemas change rarely, so they can be reused for a while
+SCHEMA_CACHE_TTL_SECONDS = 300
+
+# A p_event_time comparison after WHERE or AND, possibly on a later line
+_P_EVENT_TIME_FILTER_RE = re.compile(
+    r"\b(?:where|and)\s+.*?(?:[\w.]+\.)?p_event_time\s*(?:>=|<=|=|>|<|between)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_NORMALIZED_NAME_RE = re.compile(r"^[a-zA-Z_-][a-zA-Z0-9_-]*$")
+
+
+def _is_success(result: Dict[str, Any]) -> bool:
+    return result.get("success", False)
+
+
+def _tool_envelope(action: str) -> Callable:
+    """Turn exceptions raised by a tool into a failure response.
+
+    Args:
+        action: What the tool does, used in the log and the message as "Failed to {action}"
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error("Failed to %s: %s", action, e)
+                return {"success": False, "message": f"Failed to {action}: {e!s}"}
+
+        return wrapper
+
+    return decorator
+
+
+def _sql_string(value: str) -> str:
+    """Quote a value as a Snowflake string literal."""
+    return "'" + value.replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+# Every call sends the same SQL text apart from the quoted values filled in
+_SUMMARIZE_ALERT_EVENTS_SQL = """
+SELECT
+    DATE_TRUNC('DAY', cs.p_event_time) AS event_day,
+    DATE_TRUNC('MINUTE', DATEADD('MINUTE', {time_window} * FLOOR(EXTRACT(MINUTE FROM cs.p_event_time) / {time_window}),
+        DATE_TRUNC('HOUR', cs.p_event_time))) AS time_{time_window}_minute,
+    cs.p_log_type,
+    cs.p_any_ip_addresses AS source_ips,
+    cs.p_any_emails AS emails,
+    cs.p_any_usernames AS usernames,
+    cs.p_any_trace_ids AS trace_ids,
+    COUNT(DISTINCT cs.p_alert_id) AS alert_count,
+    ARRAY_AGG(DISTINCT cs.p_alert_id) AS alert_ids,
+    ARRAY_AGG(DISTINCT cs.p_rule_id) AS rule_ids,
+    MIN(cs.p_event_time) AS first_event,
+    MAX(cs.p_event_time) AS last_event,
+    ARRAY_AGG(DISTINCT cs.p_alert_severity) AS severities
+FROM
+    panther_signals.public.correlation_signals cs
+WHERE
+    cs.p_alert_id IN ({alert_ids})
+AND
+    cs.p_event_time BETWEEN {start_date} AND {end_date}
+GROUP BY
+    event_day,
+    time_{time_window}_minute,
+    cs.p_log_type,
+    cs.p_any_ip_addresses,
+    cs.p_any_emails,
+    cs.p_any_usernames,
+    cs.p_any_trace_ids
+HAVING
+    COUNT(DISTINCT cs.p_alert_id) > 0
+ORDER BY
+    event_day DESC,
+    time_{time_window}_minute DESC,
+    alert_count DESC
+LIMIT 1000
+"""
+
+# Only a few time windows are allowed, so each gets its SQL filled in up front
+_SUMMARIZE_ALERT_EVENTS_SQL_BY_WINDOW = {
+    window: _SUMMARIZE_ALERT_EVENTS_SQL.format(
+        time_window=window,
+        alert_ids="{alert_ids}",
+        start_date="{start_date}",
+        end_date="{end_date}",
+    )
+    for window in (1, 5, 15, 30, 60)
+}
+
 
 @mcp_tool(
     annotations={
@@ -64,7 +181,7 @@ async def summarize_alert_events(
 
     Returns a dictionary containing query execution details and a query_id for retrieving results.
     """
-    if time_window not in [1, 5, 15, 30, 60]:
+    if time_window not in _SUMMARIZE_ALERT_EVENTS_SQL_BY_WINDOW:
         raise ValueError("Time window must be 1, 5, 15, 30, or 60")
 
     # Get default date range if not provided
@@ -73,47 +190,12 @@ async def summarize_alert_events(
         start_date = start_date or default_start
         end_date = end_date or default_end
 
-    # Convert alert IDs list to SQL array
-    alert_ids_str = ", ".join(f"'{aid}'" for aid in alert_ids)
-
-    query = f"""
-SELECT
-    DATE_TRUNC('DAY', cs.p_event_time) AS event_day,
-    DATE_TRUNC('MINUTE', DATEADD('MINUTE', {time_window} * FLOOR(EXTRACT(MINUTE FROM cs.p_event_time) / {time_window}), 
-        DATE_TRUNC('HOUR', cs.p_event_time))) AS time_{time_window}_minute,
-    cs.p_log_type,
-    cs.p_any_ip_addresses AS source_ips,
-    cs.p_any_emails AS emails,
-    cs.p_any_usernames AS usernames,
-    cs.p_any_trace_ids AS trace_ids,
-    COUNT(DISTINCT cs.p_alert_id) AS alert_count,
-    ARRAY_AGG(DISTINCT cs.p_alert_id) AS alert_ids,
-    ARRAY_AGG(DISTINCT cs.p_rule_id) AS rule_ids,
-    MIN(cs.p_event_time) AS first_event,
-    MAX(cs.p_event_time) AS last_event,
-    ARRAY_AGG(DISTINCT cs.p_alert_severity) AS severities
-FROM
-    panther_signals.public.correlation_signals cs
-WHERE
-    cs.p_alert_id IN ({alert_ids_str})
-AND 
-    cs.p_event_time BETWEEN '{start_date}' AND '{end_date}'
-GROUP BY
-    event_day,
-    time_{time_window}_minute,
-    cs.p_log_type,
-    cs.p_any_ip_addresses,
-    cs.p_any_emails,
-    cs.p_any_usernames,
-    cs.p_any_trace_ids
-HAVING
-    COUNT(DISTINCT cs.p_alert_id) > 0
-ORDER BY
-    event_day DESC,
-    time_{time_window}_minute DESC,
-    alert_count DESC
-LIMIT 1000
-"""
+    query = _SUMMARIZE_ALERT_EVENTS_SQL_BY_WINDOW[time_window].format(
+        # Sorted and de-duplicated so the same alerts give the same SQL text
+        alert_ids=", ".join(map(_sql_string, sorted(set(alert_ids)))),
+        start_date=_sql_string(start_date),
+        end_date=_sql_string(end_date),
+    )
     return await execute_data_lake_query(query, "panther_signals.public")
 
 
@@ -122,6 +204,7 @@ LIMIT 1000
         "permissions": all_perms(Permission.DATA_ANALYTICS_READ),
     }
 )
+@_tool_envelope("execute data lake query")
 async def execute_data_lake_query(
     sql: Annotated[
         str,
@@ -131,8 +214,8 @@ async def execute_data_lake_query(
     ],
     database_name: Annotated[
         Optional[str],
-        Field(description="The database to query.", default="panther_logs.public"),
-    ] = "panther_logs.public",
+        Field(description="The database to query.", default=DEFAULT_DATABASE),
+    ] = DEFAULT_DATABASE,
 ) -> Dict[str, Any]:
     """Execute custom SQL queries against Panther's data lake for advanced data analysis and aggregation. This tool requires a p_event_time filter condition and should only be called five times per user request. For simple log sampling, use get_sample_log_events instead. The query must follow Snowflake SQL syntax (e.g., use field:nested_field instead of field.nested_field).
 
@@ -146,11 +229,7 @@ async def execute_data_lake_query(
     logger.info("Executing data lake query")
 
     # Validate that the query includes a p_event_time filter after WHERE or AND
-    sql_lower = sql.lower().replace("\n", " ")
-    if not re.search(
-        r"\b(where|and)\s+.*?(?:[\w.]+\.)?p_event_time\s*(>=|<=|=|>|<|between)",
-        sql_lower,
-    ):
+    if not _P_EVENT_TIME_FILTER_RE.search(sql):
         error_msg = (
             "Query must include p_event_time as a filter condition after WHERE or AND"
         )
@@ -160,36 +239,25 @@ async def execute_data_lake_query(
             "message": error_msg,
         }
 
-    try:
-        client = await _create_panther_client()
+    # Prepare input variables
+    variables = {"input": {"sql": sql, "databaseName": database_name}}
 
-        # Prepare input variables
-        variables = {"input": {"sql": sql, "databaseName": database_name}}
+    logger.debug("Query variables: %s", variables)
 
-        logger.debug(f"Query variables: {variables}")
+    # Execute the query on the shared GraphQL session
+    session = await _get_gql_session()
+    result = await session.execute(EXECUTE_DATA_LAKE_QUERY, variable_values=variables)
 
-        # Execute the query asynchronously
-        async with client as session:
-            result = await session.execute(
-                EXECUTE_DATA_LAKE_QUERY, variable_values=variables
-            )
+    # Get query ID from result
+    query_id = result.get("executeDataLakeQuery", {}).get("id")
 
-        # Get query ID from result
-        query_id = result.get("executeDataLakeQuery", {}).get("id")
+    if not query_id:
+        raise ValueError("No query ID returned from execution")
 
-        if not query_id:
-            raise ValueError("No query ID returned from execution")
+    logger.info("Successfully executed query with ID: %s", query_id)
 
-        logger.info(f"Successfully executed query with ID: {query_id}")
-
-        # Format the response
-        return {"success": True, "query_id": query_id}
-    except Exception as e:
-        logger.error(f"Failed to execute data lake query: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Failed to execute data lake query: {str(e)}",
-        }
+    # Format the response
+    return {"success": True, "query_id": query_id}
 
 
 @mcp_tool(
@@ -197,6 +265,8 @@ async def execute_data_lake_query(
         "permissions": all_perms(Permission.DATA_ANALYTICS_READ),
     }
 )
+@single_flight
+@_tool_envelope("fetch data lake query results")
 async def get_data_lake_query_results(
     query_id: Annotated[
         str,
@@ -205,108 +275,194 @@ async def get_data_lake_query_results(
             example="1234567890",
         ),
     ],
+    page_size: Annotated[
+        int,
+        Field(
+            description="The maximum number of result rows to return",
+            ge=1,
+            le=999,
+        ),
+    ] = 999,
+    cursor: Annotated[
+        Optional[str],
+        Field(
+            description="The end_cursor of a previous call, to fetch the next page of results"
+        ),
+    ] = None,
+    wait_seconds: Annotated[
+        int,
+        Field(
+            description="How long to wait for a running query to finish before returning",
+            ge=0,
+            le=60,
+        ),
+    ] = 0,
+    columnar: Annotated[
+        bool,
+        Field(
+            description="Return results as one list of values per column instead of one object per row"
+        ),
+    ] = False,
+    raw: Annotated[
+        bool,
+        Field(
+            description="Return Panther's response JSON unchanged instead of the formatted result"
+        ),
+    ] = False,
 ) -> Dict[str, Any]:
     """Get the results of a previously executed data lake query.
 
+    Results are paginated. When has_next_page is true, call again with the returned
+    end_cursor to fetch the next page. Pass wait_seconds to wait for a running query
+    in one call instead of calling repeatedly while the status is "running".
+
     Returns:
         Dict containing:
         - success: Boolean indicating if the query was successful
         - status: Status of the query (e.g., "succeeded", "running", "failed", "cancelled")
         - message: Error message if unsuccessful
-        - results: List of query result rows
+        - results: List of query result rows, or a dict mapping each column name
+          to its list of values when columnar is true
         - column_info: Dict containing column names and types
         - stats: Dict containing stats about the query
         - has_next_page: Boolean indicating if there are more results available
         - end_cursor: Cursor for fetching the next page of results, or null if no more pages
-    """
-    logger.info(f"Fetching data lake queryresults for query ID: {query_id}")
 
-    try:
-        client = await _create_panther_client()
-
-        # Prepare input variables
-        variables = {"id": query_id, "root": False}
-
-        logger.debug(f"Query variables: {variables}")
-
-        # Execute the query asynchronously
-        async with client as session:
-            result = await session.execute(
-                GET_DATA_LAKE_QUERY, variable_values=variables
-            )
+        When raw is true and the query succeeded, the dict instead contains:
+        - success: True
+        - status: "succeeded"
+        - raw_json: Panther's GraphQL response, passed through without being
+          decoded, with the rows under data.dataLakeQuery.results.edges, the
+          cursor under its pageInfo and any GraphQL errors under errors
+    """
+    logger.info("Fetching data lake queryresults for query ID: %s", query_id)
 
-        # Get query data
-        query_data = result.get("dataLakeQuery", {})
+    if cursor and cursor.lower() == "null":  # Treat a "null" cursor as no cursor
+        cursor = None
 
-        if not query_data:
-            logger.warning(f"No query found with ID: {query_id}")
-            return {"success": False, "message": f"No query found with ID: {query_id}"}
-
-        # Get query status
-        status = query_data.get("status")
-        if status == "running":
-            return {
-                "success": True,
-                "status": "running",
-                "message": "Query is still running",
-            }
-        elif status == "failed":
-            return {
-                "success": False,
-                "status": "failed",
-                "message": query_data.get("message", "Query failed"),
-            }
-        elif status == "cancelled":
-            return {
-                "success": False,
-                "status": "cancelled",
-                "message": "Query was cancelled",
-            }
-
-        # Get results data
-        results = query_data.get("results", {})
-        edges = results.get("edges", [])
-        column_info = results.get("columnInfo", {})
-        stats = results.get("stats", {})
-
-        # Extract results from edges
-        query_results = [edge["node"] for edge in edges]
-
-        logger.info(
-            f"Successfully retrieved {len(query_results)} results for query ID: {query_id}"
-        )
+    # Prepare input variables
+    variables = {
+        "id": query_id,
+        "root": False,
+        "pageSize": page_size,
+        "cursor": cursor,
+        # A cursor comes from an earlier page, so the query has already
+        # succeeded. Otherwise only the status is checked until it has, so
+        # polling a running query never selects the result rows. Raw rows are
+        # always fetched separately, so they are never decoded.
+        "includeResults": cursor is not None and not raw,
+    }
 
-        # Format the response
+    logger.debug("Query variables: %s", variables)
+
+    # Execute the query on the shared GraphQL session
+    session = await _get_gql_session()
+    result = await session.execute(GET_DATA_LAKE_QUERY, variable_values=variables)
+
+    # Get query data
+    query_data = result.get("dataLakeQuery", {})
+
+    if not query_data:
+        logger.warning("No query found with ID: %s", query_id)
+        return {"success": False, "message": f"No query found with ID: {query_id}"}
+
+    # Poll the status, backing off, until the query finishes or the wait is over
+    deadline = time.monotonic() + wait_seconds
+    delay = QUERY_POLL_INITIAL_DELAY_SECONDS
+    while query_data.get("status") == "running":
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, QUERY_POLL_MAX_DELAY_SECONDS)
+        result = await session.execute(GET_DATA_LAKE_QUERY, variable_values=variables)
+        query_data = result.get("dataLakeQuery") or query_data
+
+    # Get query status
+    status = query_data.get("status")
+    if status == "running":
         return {
             "success": True,
-            "status": status,
-            "results": query_results,
-            "column_info": {
-                "order": column_info.get("order", []),
-                "types": column_info.get("types", {}),
-            },
-            "stats": {
-                "bytes_scanned": stats.get("bytesScanned", 0),
-                "execution_time": stats.get("executionTime", 0),
-                "row_count": stats.get("rowCount", 0),
-            },
-            "has_next_page": results.get("pageInfo", {}).get("hasNextPage", False),
-            "end_cursor": results.get("pageInfo", {}).get("endCursor"),
-            "message": query_data.get("message", "Query executed successfully"),
+            "status": "running",
+            "message": "Query is still running",
         }
-    except Exception as e:
-        logger.error(f"Failed to fetch data lake query results: {str(e)}")
+    elif status == "failed":
         return {
             "success": False,
-            "message": f"Failed to fetch data lake query results: {str(e)}",
+            "status": "failed",
+            "message": query_data.get("message", "Query failed"),
+        }
+    elif status == "cancelled":
+        return {
+            "success": False,
+            "status": "cancelled",
+            "message": "Query was cancelled",
         }
 
+    if raw:
+        # Pass the body through untouched instead of decoding and re-encoding it
+        body = await session.client.transport.execute_raw(
+            GET_DATA_LAKE_QUERY, {**variables, "includeResults": True}
+        )
+        logger.info("Returning raw results for query ID: %s", query_id)
+        return {"success": True, "status": status, "raw_json": RawJSON(body)}
+
+    if not variables["includeResults"]:
+        result = await session.execute(
+            GET_DATA_LAKE_QUERY,
+            variable_values={**variables, "includeResults": True},
+        )
+        query_data = result.get("dataLakeQuery", {})
+
+    # Get results data
+    results = query_data.get("results", {})
+    edges = results.get("edges", [])
+    column_info = results.get("columnInfo", {})
+    stats = results.get("stats", {})
+
+    # Extract results from edges
+    rows = list(map(itemgetter("node"), edges))
+    if columnar:
+        query_results = {
+            name: [row.get(name) for row in rows]
+            for name in column_info.get("order", [])
+        }
+    else:
+        query_results = rows
+
+    logger.info(
+        "Successfully retrieved %d results for query ID: %s",
+        len(rows),
+        query_id,
+    )
+
+    # Format the response
+    return {
+        "success": True,
+        "status": status,
+        "results": query_results,
+        "column_info": {
+            "order": column_info.get("order", []),
+            "types": column_info.get("types", {}),
+        },
+        "stats": {
+            "bytes_scanned": stats.get("bytesScanned", 0),
+            "execution_time": stats.get("executionTime", 0),
+            "row_count": stats.get("rowCount", 0),
+        },
+        "has_next_page": results.get("pageInfo", {}).get("hasNextPage", False),
+        "end_cursor": results.get("pageInfo", {}).get("endCursor"),
+        "message": query_data.get("message", "Query executed successfully"),
+    }
+
 
 @mcp_tool(
     annotations={
         "permissions": all_perms(Permission.DATA_ANALYTICS_READ),
     }
 )
+@async_ttl_cache(ttl=SCHEMA_CACHE_TTL_SECONDS, cache_if=_is_success)
+@_tool_envelope("fetch database results")
 async def list_databases() -> Dict[str, Any]:
     """List all available datalake databases in Panther.
 
@@ -321,37 +477,159 @@ async def list_databases() -> Dict[str, Any]:
 
     logger.info("Fetching datalake databases")
 
+    # Execute the query on the shared GraphQL session
+    session = await _get_gql_session()
+    result = await session.execute(LIST_DATABASES_QUERY)
+
+    # Get query data
+    databases = result.get("dataLakeDatabases", [])
+
+    if not databases:
+        logger.warning("No databases found")
+        return {"success": False, "message": "No databases found"}
+
+    logger.info("Successfully retrieved %d results", len(databases))
+
+    # Format the response
+    return {
+        "success": True,
+        "status": "succeeded",
+        "databases": databases,
+        "stats": {
+            "database_count": len(databases),
+        },
+    }
+
+
+async def _fetch_tables_page(
+    session: AsyncClientSession,
+    database: str,
+    page_size: int,
+    cursor: Optional[str],
+) -> Dict[str, Any]:
+    """Fetch one page of tables in a database.
+
+    The page always has edges and pageInfo, since the query selects both.
+    """
+    # Prepare input variables
+    variables = {
+        "databaseName": database,
+        "pageSize": page_size,
+        "cursor": cursor,
+    }
+
+    logger.debug("Query variables: %s", variables)
+
+    result = await session.execute(LIST_TABLES_QUERY, variable_values=variables)
+    return result["dataLakeDatabaseTables"]
+
+
+async def _iter_database_tables(
+    session: AsyncClientSession,
+    database: str,
+    page_size: int = 100,
+    cursor: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield every table in a database as its page arrives, tagged with the database name.
+
+    Pages are chained by cursor, but the next page is requested as soon as its
+    cursor is known, so it downloads while the caller consumes the current page.
+
+    Args:
+        session: The GraphQL session to run the queries on
+        database: The name of the database to list tables for
+        page_size: Number of tables to request per page
+        cursor: Cursor to resume from, or None to start at the first page
+
+    Yields:
+        Each table in the database
+    """
+    logger.info("Fetching tables for database: %s", database)
+
+    next_page = asyncio.create_task(
+        _fetch_tables_page(session, database, page_size, cursor)
+    )
     try:
-        client = await _create_panther_client()
+        while next_page is not None:
+            page = await next_page
+
+            # Request the next page before handing out this one
+            page_info = page["pageInfo"]
+            next_page = None
+            if page_info["hasNextPage"]:
+                next_page = asyncio.create_task(
+                    _fetch_tables_page(
+                        session, database, page_size, page_info["endCursor"]
+                    )
+                )
 
-        # Execute the query asynchronously
-        async with client as session:
-            result = await session.execute(LIST_DATABASES_QUERY)
+            for table in page["edges"]:
+                yield {**table["node"], "database": database}
+    finally:
+        # Stop a prefetch the caller no longer needs
+        if next_page is not None:
+            next_page.cancel()
 
-        # Get query data
-        databases = result.get("dataLakeDatabases", [])
 
-        if not databases:
-            logger.warning("No databases found")
-            return {"success": False, "message": "No databases found"}
+async def _fetch_database_tables(
+    session: AsyncClientSession,
+    database: str,
+    page_size: int = 100,
+    cursor: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Collect every table in a database into a list.
 
-        logger.info(f"Successfully retrieved {len(databases)} results")
+    Independent databases can be fetched concurrently by gathering several calls.
+    """
+    return [
+        table
+        async for table in _iter_database_tables(session, database, page_size, cursor)
+    ]
 
-        # Format the response
-        return {
-            "success": True,
-            "status": "succeeded",
-            "databases": databases,
-            "stats": {
-                "database_count": len(databases),
-            },
-        }
-    except Exception as e:
-        logger.error(f"Failed to fetch database results: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Failed to fetch database results: {str(e)}",
-        }
+
+async def _fetch_tables_for_databases(
+    session: AsyncClientSession, databases: List[str], page_size: int = 100
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch the tables of several databases, sharing one request for the first pages.
+
+    The first page of every database is requested in a single aliased query. Only
+    databases with more pages are followed up, concurrently with each other.
+
+    Args:
+        session: The GraphQL session to run the queries on
+        databases: The names of the databases to list tables for
+        page_size: Number of tables to request per page
+
+    Returns:
+        Dict mapping each database name to its list of tables
+    """
+    if not databases:
+        return {}
+
+    variables = {f"db{index}": database for index, database in enumerate(databases)}
+    variables["pageSize"] = page_size
+    result = await session.execute(
+        get_tables_query_for_databases(len(databases)), variable_values=variables
+    )
+
+    tables_by_database = {}
+    follow_ups = {}
+    for index, database in enumerate(databases):
+        page = result[f"db{index}"]
+        tables_by_database[database] = [
+            {**edge["node"], "database": database} for edge in page["edges"]
+        ]
+        if page["pageInfo"]["hasNextPage"]:
+            follow_ups[database] = _fetch_database_tables(
+                session, database, page_size, page["pageInfo"]["endCursor"]
+            )
+
+    # Databases with more pages are followed up concurrently
+    remaining = await asyncio.gather(*follow_ups.values())
+    for database, tables in zip(follow_ups, remaining):
+        tables_by_database[database].extend(tables)
+
+    return tables_by_database
 
 
 @mcp_tool(
@@ -359,6 +637,8 @@ async def list_databases() -> Dict[str, Any]:
         "permissions": all_perms(Permission.DATA_ANALYTICS_READ),
     }
 )
+@async_ttl_cache(ttl=SCHEMA_CACHE_TTL_SECONDS, cache_if=_is_success)
+@_tool_envelope("fetch tables")
 async def list_database_tables(
     database: Annotated[
         str,
@@ -384,55 +664,178 @@ async def list_database_tables(
     """
     logger.info("Fetching available tables")
 
-    all_tables = []
-    page_size = 100
+    session = await _get_gql_session()
+    all_tables = [table async for table in _iter_database_tables(session, database)]
+
+    # Format the response
+    return {
+        "success": True,
+        "status": "succeeded",
+        "tables": all_tables,
+        "stats": {
+            "table_count": len(all_tables),
+        },
+    }
+
+
+@mcp_tool(
+    annotations={
+        "permissions": all_perms(Permission.DATA_ANALYTICS_READ),
+    }
+)
+@_tool_envelope("fetch tables")
+async def list_tables_for_databases(
+    databases: Annotated[
+        List[str],
+        Field(
+            description="The names of the databases to list tables for",
+            example=["panther_logs.public", "panther_cloudsecurity.public"],
+            min_length=1,
+        ),
+    ],
+) -> Dict[str, Any]:
+    """List all available tables in several Panther Databases at once.
+
+    The first page of every database is fetched in a single request, so this is
+    faster than calling list_database_tables once per database.
 
+    Required: Only use valid database names obtained from list_databases
+
+    Returns:
+        Dict containing:
+        - success: Boolean indicating if the query was successful
+        - tables: Dict mapping each database name to its list of tables, each containing:
+            - name: Table name
+            - description: Table description
+            - log_type: Log type
+            - database: Database name
+        - message: Error message if unsuccessful
+    """
+    logger.info("Fetching available tables for %d databases", len(databases))
+
+    session = await _get_gql_session()
+    tables_by_database = await _fetch_tables_for_databases(
+        session, list(dict.fromkeys(databases))
+    )
+
+    return {
+        "success": True,
+        "status": "succeeded",
+        "tables": tables_by_database,
+        "stats": {
+            "table_count": sum(len(tables) for tables in tables_by_database.values()),
+        },
+    }
+
+
+# Parallel tool calls arrive as separate messages a few milliseconds apart, so
+# column lookups wait slightly longer than alert updates so more share a batch
+_column_lookup_batcher = AsyncBatcher(delay=0.01)
+
+
+async def _execute_column_lookup(
+    tables: List[Tuple[str, str]], include_descriptions: bool = True
+) -> List[Dict[str, Any]]:
+    """Fetch the columns of a batch of (database, table) pairs in one aliased query.
+
+    A missing table fails the whole aliased query, so a failed batch is retried
+    one table at a time and each table gets back its own error.
+    """
+    variables = {"includeDescriptions": include_descriptions}
+    for index, (database_name, table_name) in enumerate(tables):
+        variables[f"t{index}Database"] = database_name
+        variables[f"t{index}Table"] = table_name
+
+    logger.debug("Query variables: %s", variables)
+
+    session = await _get_gql_session()
     try:
-        client = await _create_panther_client()
-        logger.info(f"Fetching tables for database: {database}")
-        cursor = None
+        result = await session.execute(
+            get_columns_query_for_tables(len(tables)), variable_values=variables
+        )
+    except Exception:
+        if len(tables) == 1:
+            raise
+        lookups = await asyncio.gather(
+            *(
+                _execute_column_lookup([table], include_descriptions)
+                for table in tables
+            ),
+            return_exceptions=True,
+        )
+        return [
+            {"id": table, "error": lookup}
+            if isinstance(lookup, Exception)
+            else lookup[0]
+            for table, lookup in zip(tables, lookups)
+        ]
 
-        while True:
-            # Prepare input variables
-            variables = {
-                "databaseName": database,
-                "pageSize": page_size,
-                "cursor": cursor,
-            }
+    return [
+        {"id": table, "table": result.get(f"t{index}")}
+        for index, table in enumerate(tables)
+    ]
 
-            logger.debug(f"Query variables: {variables}")
 
-            # Execute the query asynchronously
-            async with client as session:
-                result = await session.execute(
-                    LIST_TABLES_QUERY, variable_values=variables
-                )
+@mcp_tool(
+    annotations={
+        "permissions": all_perms(Permission.DATA_ANALYTICS_READ),
+    }
+)
+@_tool_envelope("fetch tables")
+async def list_database_tables_paged(
+    database: Annotated[
+        str,
+        Field(
+            description="The name of the database to list tables for",
+            example="panther_logs.public",
+        ),
+    ],
+    cursor: Annotated[
+        Optional[str],
+        Field(
+            description="The end_cursor of a previous call, to fetch the next page of tables"
+        ),
+    ] = None,
+    page_size: Annotated[
+        int,
+        Field(description="The maximum number of tables to return", ge=1, le=100),
+    ] = 100,
+) -> Dict[str, Any]:
+    """List one page of tables in a Panther Database.
 
-            # Get query data
-            result = result.get("dataLakeDatabaseTables", {})
-            for table in result.get("edges", []):
-                all_tables.append(table["node"])
+    Use this instead of list_database_tables for databases with many tables, and
+    stop paging once the table you need has been found.
 
-            # Check if there are more pages
-            page_info = result["pageInfo"]
-            if not page_info["hasNextPage"]:
-                break
+    Required: Only use valid database names obtained from list_databases
 
-            # Update cursor for next page
-            cursor = page_info["endCursor"]
+    Returns:
+        Dict containing:
+        - success: Boolean indicating if the query was successful
+        - tables: List of tables on this page, each containing:
+            - name: Table name
+            - description: Table description
+            - log_type: Log type
+            - database: Database name
+        - has_next_page: Boolean indicating if there are more tables available
+        - end_cursor: Cursor for fetching the next page of tables, or null if no more pages
+        - message: Error message if unsuccessful
+    """
+    logger.info("Fetching a page of tables for database: %s", database)
 
-        # Format the response
-        return {
-            "success": True,
-            "status": "succeeded",
-            "tables": all_tables,
-            "stats": {
-                "table_count": len(all_tables),
-            },
-        }
-    except Exception as e:
-        logger.error(f"Failed to fetch tables: {str(e)}")
-        return {"success": False, "message": f"Failed to fetch tables: {str(e)}"}
+    if cursor and cursor.lower() == "null":  # Treat a "null" cursor as no cursor
+        cursor = None
+
+    session = await _get_gql_session()
+    page = await _fetch_tables_page(session, database, page_size, cursor)
+    page_info = page["pageInfo"]
+
+    return {
+        "success": True,
+        "status": "succeeded",
+        "tables": [{**edge["node"], "database": database} for edge in page["edges"]],
+        "has_next_page": page_info["hasNextPage"],
+        "end_cursor": page_info["endCursor"],
+    }
 
 
 @mcp_tool(
@@ -440,6 +843,8 @@ async def list_database_tables(
         "permissions": all_perms(Permission.DATA_ANALYTICS_READ),
     }
 )
+@async_ttl_cache(ttl=SCHEMA_CACHE_TTL_SECONDS, cache_if=_is_success)
+@_tool_envelope("get columns for table")
 async def get_table_schema(
     database_name: Annotated[
         str,
@@ -455,6 +860,12 @@ async def get_table_schema(
             example="Panther.Audit",
         ),
     ],
+    include_descriptions: Annotated[
+        bool,
+        Field(
+            description="Whether to return table and column descriptions. Set to false when only column names and types are needed."
+        ),
+    ] = True,
 ) -> Dict[str, Any]:
     """Get column details for a specific datalake table.
 
@@ -479,61 +890,49 @@ async def get_table_schema(
         - columns: List of columns, each containing:
             - name: Column name
             - type: Column data type
-            - description: Column description
+            - description: Column description, unless include_descriptions is false
         - message: Error message if unsuccessful
     """
     table_full_path = f"{database_name}.{table_name}"
-    logger.info(f"Fetching column information for table: {table_full_path}")
-
-    try:
-        client = await _create_panther_client()
-
-        # Prepare input variables
-        variables = {"databaseName": database_name, "tableName": table_name}
-
-        logger.debug(f"Query variables: {variables}")
-
-        # Execute the query asynchronously
-        async with client as session:
-            result = await session.execute(
-                GET_COLUMNS_FOR_TABLE_QUERY, variable_values=variables
-            )
-
-        # Get query data
-        query_data = result.get("dataLakeDatabaseTable", {})
-        columns = query_data.get("columns", [])
-
-        if not columns:
-            logger.warning(f"No columns found for table: {table_full_path}")
-            return {
-                "success": False,
-                "message": f"No columns found for table: {table_full_path}",
-            }
+    logger.info("Fetching column information for table: %s", table_full_path)
+
+    # Concurrent lookups for other tables share one request
+    (lookup,) = await _column_lookup_batcher.submit(
+        ("columns", include_descriptions),
+        [(database_name, table_name)],
+        functools.partial(
+            _execute_column_lookup, include_descriptions=include_descriptions
+        ),
+    )
+    if "error" in lookup:
+        raise lookup["error"]
 
-        logger.info(f"Successfully retrieved {len(columns)} columns")
+    # Get query data
+    query_data = lookup["table"] or {}
+    columns = query_data.get("columns", [])
 
-        # Format the response
-        return {
-            "success": True,
-            "status": "succeeded",
-            **query_data,
-            "stats": {
-                "table_count": len(columns),
-            },
-        }
-    except Exception as e:
-        logger.error(f"Failed to get columns for table: {str(e)}")
+    if not columns:
+        logger.warning("No columns found for table: %s", table_full_path)
         return {
             "success": False,
-            "message": f"Failed to get columns for table: {str(e)}",
+            "message": f"No columns found for table: {table_full_path}",
         }
 
+    logger.info("Successfully retrieved %d columns", len(columns))
+
+    # Format the response in place, since query_data is freshly decoded
+    query_data["success"] = True
+    query_data["status"] = "succeeded"
+    query_data["stats"] = {"table_count": len(columns)}
+    return query_data
+
 
 @mcp_tool(
     annotations={
         "permissions": all_perms(Permission.DATA_ANALYTICS_READ),
     }
 )
+@_tool_envelope("fetch sample log events")
 async def get_sample_log_events(
     schema_name: Annotated[
         str,
@@ -575,29 +974,22 @@ async def get_sample_log_events(
         3. Highlight key fields and patterns across records
     """
 
-    logger.info(f"Fetching sample log events for schema: {schema_name}")
+    logger.info("Fetching sample log events for schema: %s", schema_name)
 
-    database_name = "panther_logs.public"
+    database_name = DEFAULT_DATABASE
     table_name = _normalize_name(schema_name)
 
-    try:
-        sql = f"""
-        SELECT *
-        FROM {database_name}.{table_name}
-        WHERE p_event_time >= DATEADD(day, -7, CURRENT_TIMESTAMP())
-        ORDER BY p_event_time DESC
-        LIMIT 10
-        """
-
-        result = await execute_data_lake_query(sql=sql, database_name=database_name)
-
-        return result
-    except Exception as e:
-        logger.error(f"Failed to fetch sample log events: {str(e)}")
-        return {
-            "success": False,
-            "message": f"Failed to fetch sample log events: {str(e)}",
-        }
+    sql = f"""
+    SELECT *
+    FROM {database_name}.{table_name}
+    WHERE p_event_time >= DATEADD(day, -7, CURRENT_TIMESTAMP())
+    ORDER BY p_event_time DESC
+    LIMIT 10
+    """
+
+    result = await execute_data_lake_query(sql=sql, database_name=database_name)
+
+    return result
 
 
 transliterate_chars = {
@@ -632,58 +1024,59 @@ number_to_word = {
 }
 
 
+# Letters, digits, underscores and hyphens are kept. Other ASCII characters are
+# spelled out when they have a transliteration, and replaced with an underscore
+# otherwise. Non-ASCII characters are left for _transliterate_non_ascii.
+_NAME_TRANSLATION = str.maketrans(
+    {
+        chr(code): "_"
+        for code in range(128)
+        if not (chr(code).isalnum() or chr(code) in "_-")
+    }
+    | {c: f"_{word}_" for c, word in transliterate_chars.items()}
+)
+
+
 def _is_name_normalized(name):
     """Check if a table name is already normalized"""
-    if not re.match(r"^[a-zA-Z_-][a-zA-Z0-9_-]*$", name):
+    if not _NORMALIZED_NAME_RE.match(name):
         return False
 
     return True
 
 
+def _transliterate_non_ascii(c):
+    """Transliterate a non-ASCII character, or replace it with an underscore"""
+    transliterated = anyascii.anyascii(c)
+    if transliterated and transliterated != "'" and transliterated != " ":
+        return transliterated
+    return "_"
+
+
+# Agents sample the same few log types over and over
+@functools.lru_cache(maxsize=512)
 def _normalize_name(name):
     """Normalize a table name"""
     if _is_name_normalized(name):
         return name
 
-    result = []
-    characters = list(name)
-    last = len(characters) - 1
-
-    for i, c in enumerate(characters):
-        if "a" <= c <= "z" or "A" <= c <= "Z":
-            # Allow uppercase and lowercase letters
-            result.append(c)
-        elif "0" <= c <= "9":
-            if i == 0:
-                # Convert numbers at the start of the string to words
-                result.append(number_to_word[c])
-                result.append("_")
-            else:
-                # Allow numbers beyond the first character
-                result.append(c)
-        elif c == "_" or c == "-":
-            # Allow underscores and hyphens
-            result.append(c)
-        else:
-            # Check if we have a specific transliteration for this character
-            if c in transliterate_chars:
-                if i > 0:
-                    result.append("_")
-
-                result.append(transliterate_chars[c])
-
-                if i < last:
-                    result.append("_")
-                continue
-
-            # Try to handle non-ASCII letters
-            if ord(c) > 127:
-                transliterated = anyascii.anyascii(c)
-                if transliterated and transliterated != "'" and transliterated != " ":
-                    result.append(transliterated)
-                    continue
-
-            # Fallback to underscore
-            result.append("_")
-
-    return "".join(result)
+    prefix = ""
+    if name[:1] in number_to_word:
+        # Convert a number at the start of the string to a word
+        prefix = number_to_word[name[0]] + "_"
+        name = name[1:]
+
+    result = name.translate(_NAME_TRANSLATION)
+
+    # A transliteration at either end of the name has no underscore on that side
+    if not prefix and name[:1] in transliterate_chars:
+        result = result[1:]
+    if name[-1:] in transliterate_chars:
+        result = result[:-1]
+
+    if not result.isascii():
+        result = "".join(
+            c if c.isascii() else _transliterate_non_ascii(c) for c in result
+        )
+
+    return prefix + result
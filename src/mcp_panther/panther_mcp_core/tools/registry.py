@@ -8,13 +8,16 @@ and can be registered with the MCP server using register_all_tools().
 
 import logging
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Set
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 logger = logging.getLogger("mcp-panther")
 
 # Registry to store all decorated tools
 _tool_registry: Set[Callable] = set()
 
+# Sorted tool names, computed on first lookup and reset whenever the registry changes
+_tool_names: Optional[Tuple[str, ...]] = None
+
 
 def mcp_tool(
     func: Optional[Callable] = None,
@@ -52,6 +55,8 @@ def mcp_tool(
     """
 
     def decorator(func: Callable) -> Callable:
+        global _tool_names
+
         # Store metadata on the function
         func._mcp_tool_metadata = {
             "name": name,
@@ -59,6 +64,7 @@ def mcp_tool(
             "annotations": annotations,
         }
         _tool_registry.add(func)
+        _tool_names = None
 
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -79,12 +85,16 @@ def register_all_tools(mcp_instance) -> None:
     Args:
         mcp_instance: The FastMCP instance to register tools with
     """
-    logger.info(f"Registering {len(_tool_registry)} tools with MCP")
+    from . import load_all_tools
+
+    load_all_tools()
+
+    logger.info("Registering %d tools with MCP", len(_tool_registry))
 
     # Sort tools by name
     sorted_funcs = sorted(_tool_registry, key=lambda f: f.__name__)
     for tool in sorted_funcs:
-        logger.debug(f"Registering tool: {tool.__name__}")
+        logger.debug("Registering tool: %s", tool.__name__)
 
         # Get tool metadata if it exists
         metadata = getattr(tool, "_mcp_tool_metadata", {})
@@ -102,11 +112,14 @@ def register_all_tools(mcp_instance) -> None:
     logger.info("All tools registered successfully")
 
 
-def get_available_tool_names() -> list[str]:
+def get_available_tool_names() -> Tuple[str, ...]:
     """
-    Get a list of all registered tool names.
+    Get the sorted names of all registered tools.
 
     Returns:
-        A list of the names of all registered tools
+        A tuple of the names of all registered tools
     """
-    return sorted([tool.__name__ for tool in _tool_registry])
+    global _tool_names
+    if _tool_names is None:
+        _tool_names = tuple(sorted(tool.__name__ for tool in _tool_registry))
+    return _tool_names
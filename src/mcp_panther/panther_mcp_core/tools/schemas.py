@@ -3,9 +3,10 @@ Tools for interacting with Panther schemas.
 """
 
 import logging
+from operator import itemgetter
 from typing import Any, Dict
 
-from ..client import _create_panther_client
+from ..client import _get_gql_session
 from ..permissions import Permission, all_perms
 from ..queries import GET_SCHEMA_DETAILS_QUERY, LIST_SCHEMAS_QUERY
 from .registry import mcp_tool
@@ -52,8 +53,6 @@ async def list_log_type_schemas(
     logger.info("Fetching available schemas")
 
     try:
-        client = await _create_panther_client()
-
         # Prepare input variables, only including non-None values
         input_vars = {}
         if contains is not None:
@@ -67,11 +66,9 @@ async def list_log_type_schemas(
 
         variables = {"input": input_vars}
 
-        # Execute the query asynchronously
-        async with client as session:
-            result = await session.execute(
-                LIST_SCHEMAS_QUERY, variable_values=variables
-            )
+        # Execute the query on the shared GraphQL session
+        session = await _get_gql_session()
+        result = await session.execute(LIST_SCHEMAS_QUERY, variable_values=variables)
 
         # Get schemas data and ensure we have the required structure
         schemas_data = result.get("schemas")
@@ -80,9 +77,9 @@ async def list_log_type_schemas(
 
         edges = schemas_data.get("edges", [])
 
-        schemas = [edge["node"] for edge in edges] if edges else []
+        schemas = list(map(itemgetter("node"), edges))
 
-        logger.info(f"Successfully retrieved {len(schemas)} schemas")
+        logger.info("Successfully retrieved %d schemas", len(schemas))
 
         # Format the response
         return {
@@ -91,7 +88,7 @@ async def list_log_type_schemas(
         }
 
     except Exception as e:
-        logger.error(f"Failed to fetch schemas: {str(e)}")
+        logger.error("Failed to fetch schemas: %s", e)
         return {
             "success": False,
             "message": f"Failed to fetch schemas: {str(e)}",
@@ -137,39 +134,39 @@ async def get_panther_log_type_schema(schema_names: list[str]) -> Dict[str, Any]
             "message": "Maximum of 5 schema names allowed per request",
         }
 
-    logger.info(f"Fetching detailed schema information for: {', '.join(schema_names)}")
+    logger.info("Fetching detailed schema information for: %s", ", ".join(schema_names))
 
     try:
-        client = await _create_panther_client()
+        # All schema lookups run on the shared GraphQL session
+        session = await _get_gql_session()
         all_schemas = []
 
         # Query each schema individually to ensure we get exact matches
         for name in schema_names:
             variables = {"name": name}  # Pass single name as string
 
-            async with client as session:
-                result = await session.execute(
-                    GET_SCHEMA_DETAILS_QUERY, variable_values=variables
-                )
+            result = await session.execute(
+                GET_SCHEMA_DETAILS_QUERY, variable_values=variables
+            )
 
             schemas_data = result.get("schemas")
             if not schemas_data:
-                logger.warning(f"No schema data found for {name}")
+                logger.warning("No schema data found for %s", name)
                 continue
 
             edges = schemas_data.get("edges", [])
             # The query now returns exact matches, so we can use all results
-            matching_schemas = [edge["node"] for edge in edges]
+            matching_schemas = list(map(itemgetter("node"), edges))
 
             if matching_schemas:
                 all_schemas.extend(matching_schemas)
             else:
-                logger.warning(f"No match found for schema {name}")
+                logger.warning("No match found for schema %s", name)
 
         if not all_schemas:
             return {"success": False, "message": "No matching schemas found"}
 
-        logger.info(f"Successfully retrieved {len(all_schemas)} schemas")
+        logger.info("Successfully retrieved %d schemas", len(all_schemas))
 
         return {
             "success": True,
@@ -177,7 +174,7 @@ async def get_panther_log_type_schema(schema_names: list[str]) -> Dict[str, Any]
         }
 
     except Exception as e:
-        logger.error(f"Failed to fetch schema details: {str(e)}")
+        logger.error("Failed to fetch schema details: %s", e)
         return {
             "success": False,
             "message": f"Failed to fetch schema details: {str(e)}",
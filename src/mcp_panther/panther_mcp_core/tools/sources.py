@@ -3,9 +3,10 @@ Tools for interacting with Panther log sources.
 """
 
 import logging
+from operator import itemgetter
 from typing import Any, Dict, List
 
-from ..client import _create_panther_client
+from ..client import _get_gql_session
 from ..permissions import Permission, all_perms
 from ..queries import GET_SOURCES_QUERY
 from .registry import mcp_tool
@@ -35,24 +36,22 @@ async def list_log_sources(
     logger.info("Fetching log sources from Panther")
 
     try:
-        client = await _create_panther_client()
-
         # Prepare input variables
         variables = {"input": {}}
 
         # Add cursor if provided
         if cursor:
             variables["input"]["cursor"] = cursor
-            logger.info(f"Using cursor for pagination: {cursor}")
+            logger.info("Using cursor for pagination: %s", cursor)
 
-        logger.debug(f"Query variables: {variables}")
+        logger.debug("Query variables: %s", variables)
 
-        # Execute the query asynchronously
-        async with client as session:
-            result = await session.execute(GET_SOURCES_QUERY, variable_values=variables)
+        # Execute the query on the shared GraphQL session
+        session = await _get_gql_session()
+        result = await session.execute(GET_SOURCES_QUERY, variable_values=variables)
 
         # Log the raw result for debugging
-        logger.debug(f"Raw query result: {result}")
+        logger.debug("Raw query result: %s", result)
 
         # Process results
         sources_data = result.get("sources", {})
@@ -60,14 +59,14 @@ async def list_log_sources(
         page_info = sources_data.get("pageInfo", {})
 
         # Extract sources from edges
-        sources = [edge["node"] for edge in source_edges]
+        sources = list(map(itemgetter("node"), source_edges))
 
         # Apply post-request filtering
         if is_healthy is not None:
             sources = [
                 source for source in sources if source["isHealthy"] == is_healthy
             ]
-            logger.info(f"Filtered by health status: {is_healthy}")
+            logger.info("Filtered by health status: %s", is_healthy)
 
         if log_types:
             sources = [
@@ -75,7 +74,7 @@ async def list_log_sources(
                 for source in sources
                 if any(log_type in source["logTypes"] for log_type in log_types)
             ]
-            logger.info(f"Filtered by log types: {log_types}")
+            logger.info("Filtered by log types: %s", log_types)
 
         if integration_type:
             sources = [
@@ -83,9 +82,9 @@ async def list_log_sources(
                 for source in sources
                 if source["integrationType"] == integration_type
             ]
-            logger.info(f"Filtered by integration type: {integration_type}")
+            logger.info("Filtered by integration type: %s", integration_type)
 
-        logger.info(f"Successfully retrieved {len(sources)} log sources")
+        logger.info("Successfully retrieved %d log sources", len(sources))
 
         # Format the response
         return {
@@ -98,5 +97,5 @@ async def list_log_sources(
             "start_cursor": page_info.get("startCursor"),
         }
     except Exception as e:
-        logger.error(f"Failed to fetch log sources: {str(e)}")
+        logger.error("Failed to fetch log sources: %s", e)
         return {"success": False, "message": f"Failed to fetch log sources: {str(e)}"}
@@ -3,6 +3,7 @@ import logging
 import os
 import signal
 import sys
+from contextlib import asynccontextmanager
 
 import click
 import uvicorn
@@ -10,6 +11,11 @@ from fastmcp import FastMCP
 from starlette.applications import Starlette
 from starlette.routing import Mount
 
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional speedup and is not available on Windows
+    uvloop = None
+
 # Server name
 MCP_SERVER_NAME = "mcp-panther"
 
@@ -57,10 +63,12 @@ logger = logging.getLogger(MCP_SERVER_NAME)
 # 2. When running with MCP inspector: `uv run mcp dev src/mcp_panther/server.py`
 # 3. When installing: `uv run mcp install src/mcp_panther/server.py`
 try:
+    from panther_mcp_core.client import close_client_sessions, serialize_tool_result
     from panther_mcp_core.prompts.registry import register_all_prompts
     from panther_mcp_core.resources.registry import register_all_resources
     from panther_mcp_core.tools.registry import register_all_tools
 except ImportError:
+    from .panther_mcp_core.client import close_client_sessions, serialize_tool_result
     from .panther_mcp_core.prompts.registry import register_all_prompts
     from .panther_mcp_core.resources.registry import register_all_resources
     from .panther_mcp_core.tools.registry import register_all_tools
@@ -72,8 +80,13 @@ deps = [
     "anyascii",
 ]
 
+
 # Create the MCP server
-mcp = FastMCP(MCP_SERVER_NAME, dependencies=deps)
+mcp = FastMCP(
+    MCP_SERVER_NAME,
+    dependencies=deps,
+    tool_serializer=serialize_tool_result,
+)
 
 # Register all tools with MCP using the registry
 register_all_tools(mcp)
@@ -83,6 +96,25 @@ register_all_prompts(mcp)
 register_all_resources(mcp)
 
 
+# The shared HTTP sessions are closed once per process. FastMCP's own lifespan
+# runs once per SSE connection, while the sessions serve every connection.
+@asynccontextmanager
+async def sse_app_lifespan(app: Starlette):
+    """Release shared HTTP sessions when the SSE server shuts down."""
+    try:
+        yield
+    finally:
+        await close_client_sessions()
+
+
+async def run_stdio() -> None:
+    """Serve over stdio, then release shared HTTP sessions."""
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await close_client_sessions()
+
+
 def handle_signals():
     def signal_handler(sig, frame):
         logger.info(f"Received signal {sig}, shutting down...")
@@ -125,6 +157,12 @@ def main(transport: str, port: int, host: str, log_file: str | None):
     if log_file:
         configure_logging(log_file, force=True)
 
+    # Run both transports on uvloop when it is installed. Setting the policy
+    # covers asyncio.run and FastMCP's anyio.run alike.
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+
     if transport == "sse":
         # Create the Starlette app
         app = Starlette(
@@ -132,6 +170,7 @@ def main(transport: str, port: int, host: str, log_file: str | None):
             routes=[
                 Mount("/", app=mcp.sse_app()),
             ],
+            lifespan=sse_app_lifespan,
         )
 
         logger.info(f"Starting Panther MCP Server with SSE transport on {host}:{port}")
@@ -149,5 +188,4 @@ def main(transport: str, port: int, host: str, log_file: str | None):
             os._exit(0)
     else:
         logger.info("Starting Panther MCP Server with stdio transport")
-        # Let FastMCP handle all the asyncio details internally
-        mcp.run()
+        asyncio.run(run_stdio())
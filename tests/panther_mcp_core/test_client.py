@@ -1,16 +1,34 @@
+import asyncio
+import datetime
+import gc
+import io
+import json
 import os
 from unittest import mock
 
 import pytest
-from aiohttp import ClientResponse
+from aiohttp import ClientResponse, web
+from aiohttp.test_utils import TestServer
+from gql.transport import aiohttp as gql_aiohttp
+from gql.transport.exceptions import TransportServerError
+from graphql import DocumentNode
 
+from mcp_panther.panther_mcp_core import client
 from mcp_panther.panther_mcp_core.client import (
+    PantherRestClient,
+    RawJSON,
     UnexpectedResponseStatusError,
+    _execute_query,
+    _get_today_date_range,
     _get_user_agent,
     _is_running_in_docker,
+    _parse_query,
+    _print_document,
     get_instance_config,
     get_json_from_script_tag,
     get_panther_rest_api_base,
+    get_today_date_range,
+    serialize_tool_result,
 )
 
 
@@ -29,7 +47,9 @@ def test_is_running_in_docker(env_value, expected):
         os.environ,
         {"MCP_PANTHER_DOCKER_RUNTIME": env_value} if env_value is not None else {},
     ):
+        _is_running_in_docker.cache_clear()
         assert _is_running_in_docker() == expected
+    _is_running_in_docker.cache_clear()
 
 
 @pytest.mark.parametrize(
@@ -57,16 +77,31 @@ def test_get_user_agent(docker_running, version, expected):
             "mcp_panther.panther_mcp_core.client._is_running_in_docker",
             return_value=docker_running,
         ):
+            _get_user_agent.cache_clear()
             assert _get_user_agent() == expected
+    _get_user_agent.cache_clear()
+
+
+def _mock_html_response(status, html="", chunk_size=16):
+    """Build a mock response that streams the given HTML in small chunks."""
+
+    async def iter_chunked(_):
+        data = html.encode()
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+
+    mock_response = mock.Mock(spec=ClientResponse)
+    mock_response.status = status
+    mock_response.charset = None
+    mock_response.content.iter_chunked = iter_chunked
+    return mock_response
 
 
 @pytest.mark.asyncio
 async def test_get_json_from_script_tag_success():
     """Test successful JSON extraction from script tag."""
-    mock_response = mock.Mock(spec=ClientResponse)
-    mock_response.status = 200
-    mock_response.text.return_value = (
-        '<script id="__PANTHER_CONFIG__">{"key": "value"}</script>'
+    mock_response = _mock_html_response(
+        200, '<script id="__PANTHER_CONFIG__">{"key": "value"}</script>'
     )
 
     with mock.patch("aiohttp.ClientSession.get") as mock_get:
@@ -77,12 +112,59 @@ async def test_get_json_from_script_tag_success():
         assert result == {"key": "value"}
 
 
+@pytest.mark.asyncio
+async def test_get_json_from_script_tag_skips_other_scripts():
+    """Test that only the script tag with the matching ID is used."""
+    mock_response = _mock_html_response(
+        200,
+        "<html><head>"
+        '<script id="other">{"key": "wrong"}</script>'
+        "<script type='application/json' id='__PANTHER_CONFIG__'>"
+        '{"key": "value", "name": "Müller"}'
+        "</script></head><body>never read</body></html>",
+    )
+
+    with mock.patch("aiohttp.ClientSession.get") as mock_get:
+        mock_get.return_value.__aenter__.return_value = mock_response
+        result = await get_json_from_script_tag(
+            "http://example.com", "__PANTHER_CONFIG__"
+        )
+        assert result == {"key": "value", "name": "Müller"}
+
+
+@pytest.mark.asyncio
+async def test_get_json_from_script_tag_reuses_connection(monkeypatch):
+    """Test that stopping early still leaves the connection open for reuse."""
+    transports = []
+
+    async def page(request):
+        transports.append(request.transport)
+        return web.Response(
+            text='<script id="__PANTHER_CONFIG__">{"key": "value"}</script>'
+            + "<p>filler</p>" * 10000,
+            content_type="text/html",
+        )
+
+    app = web.Application()
+    app.router.add_get("/", page)
+    monkeypatch.setattr(client, "_config_session", None)
+
+    async with TestServer(app) as server:
+        url = str(server.make_url("/"))
+        try:
+            first = await get_json_from_script_tag(url, "__PANTHER_CONFIG__")
+            second = await get_json_from_script_tag(url, "__PANTHER_CONFIG__")
+        finally:
+            await client._config_session.close()
+
+    assert first == second == {"key": "value"}
+    assert transports[0] is transports[1]
+
+
 @pytest.mark.asyncio
 async def test_get_json_from_script_tag_error():
     """Test error handling when script tag is not found."""
-    mock_response = mock.Mock(spec=ClientResponse)
-    mock_response.status = 200
-    mock_response.text.return_value = "<html><body>No config here</body></html>"
+    mock_response = _mock_html_response(200, "<html><body>No config here</body></html>")
 
     with mock.patch("aiohttp.ClientSession.get") as mock_get:
         mock_get.return_value.__aenter__.return_value = mock_response
@@ -94,8 +176,7 @@ async def test_get_json_from_script_tag_error():
 @pytest.mark.asyncio
 async def test_get_json_from_script_tag_unexpected_status():
     """Test handling of unexpected HTTP status codes."""
-    mock_response = mock.Mock(spec=ClientResponse)
-    mock_response.status = 404
+    mock_response = _mock_html_response(404)
 
     with mock.patch("aiohttp.ClientSession.get") as mock_get:
         mock_get.return_value.__aenter__.return_value = mock_response
@@ -132,6 +213,35 @@ async def test_get_instance_config_fallback():
             assert config == {"rest": "http://example.com"}
 
 
+@pytest.mark.asyncio
+async def test_get_instance_config_fetches_once(monkeypatch):
+    """Test that concurrent callers share one fetch and the result is cached."""
+    monkeypatch.setattr(client, "instance_config", None)
+    monkeypatch.setattr(client, "_instance_config_expiry", 0.0)
+
+    async def slow_fetch(url, script_id):
+        await asyncio.sleep(0)
+        return {"rest": "http://example.com"}
+
+    with mock.patch(
+        "mcp_panther.panther_mcp_core.client.get_json_from_script_tag",
+        side_effect=slow_fetch,
+    ) as mock_fetch:
+        results = await asyncio.gather(*(get_instance_config() for _ in range(5)))
+        assert await get_instance_config() == {"rest": "http://example.com"}
+
+    assert all(result == {"rest": "http://example.com"} for result in results)
+    mock_fetch.assert_called_once()
+
+    # An expired entry is fetched again
+    monkeypatch.setattr(client, "_instance_config_expiry", 0.0)
+    with mock.patch(
+        "mcp_panther.panther_mcp_core.client.get_json_from_script_tag",
+        return_value={"rest": "http://other.example.com"},
+    ):
+        assert await get_instance_config() == {"rest": "http://other.example.com"}
+
+
 @pytest.mark.asyncio
 async def test_get_panther_rest_api_base():
     """Test REST API base URL resolution."""
@@ -159,3 +269,361 @@ async def test_get_panther_rest_api_base():
     ):
         base = await get_panther_rest_api_base()
         assert base == ""
+
+
+@pytest.mark.asyncio
+async def test_execute_query_reuses_session(monkeypatch):
+    """Test that the GraphQL session is created once and reused across queries."""
+    monkeypatch.setattr(client, "_gql_client", None)
+    monkeypatch.setattr(client, "_gql_session", None)
+
+    mock_session = mock.AsyncMock()
+    mock_session.execute.return_value = {"ok": True}
+    mock_client = mock.AsyncMock()
+    mock_client.connect_async.return_value = mock_session
+    mock_client.transport.session.closed = False
+    query = _parse_query("query ListUsers { users { id } }")
+
+    with mock.patch(
+        "mcp_panther.panther_mcp_core.client._create_panther_client",
+        return_value=mock_client,
+    ) as mock_create:
+        assert await _execute_query(query, {"a": 1}) == {"ok": True}
+        assert await _execute_query(query, {"a": 2}) == {"ok": True}
+
+    mock_create.assert_called_once()
+    mock_client.connect_async.assert_called_once_with()
+    assert mock_session.execute.call_count == 2
+    mock_session.execute.assert_called_with(query, variable_values={"a": 2})
+
+
+@pytest.mark.asyncio
+async def test_gql_session_recreated_after_transport_closes(monkeypatch):
+    """Test that a closed HTTP session is replaced by a new client."""
+    closed_client = mock.AsyncMock()
+    closed_client.transport.session.closed = True
+    monkeypatch.setattr(client, "_gql_client", closed_client)
+    monkeypatch.setattr(client, "_gql_session", mock.AsyncMock())
+
+    new_session = mock.AsyncMock()
+    new_client = mock.AsyncMock()
+    new_client.connect_async.return_value = new_session
+
+    with mock.patch(
+        "mcp_panther.panther_mcp_core.client._create_panther_client",
+        return_value=new_client,
+    ):
+        assert await client._get_gql_session() is new_session
+
+    assert client._gql_client is new_client
+
+
+@pytest.mark.asyncio
+async def test_execute_query_parses_query_text_once(monkeypatch):
+    """Test that raw query strings are parsed once and the document is reused."""
+    mock_session = mock.AsyncMock()
+    monkeypatch.setattr(client, "_gql_session", mock_session)
+    _parse_query.cache_clear()
+
+    query_text = "query ListUsers { users { id } }"
+    await _execute_query(query_text, {})
+    await _execute_query(query_text, {})
+
+    first_doc = mock_session.execute.call_args_list[0].args[0]
+    second_doc = mock_session.execute.call_args_list[1].args[0]
+    assert isinstance(first_doc, DocumentNode)
+    assert first_doc is second_doc
+    assert _parse_query.cache_info().hits == 1
+
+
+def test_print_document_reuses_printed_text():
+    """Test that a document is printed once and the text reused afterwards."""
+    document = _parse_query("query ListRoles { roles { id } }")
+    with mock.patch(
+        "mcp_panther.panther_mcp_core.client.print_ast", wraps=client.print_ast
+    ) as mock_print:
+        first = _print_document(document)
+        second = _print_document(document)
+
+    assert first is second
+    assert "ListRoles" in first
+    mock_print.assert_called_once_with(document)
+
+
+@pytest.mark.asyncio
+async def test_panther_transport_prints_each_document_once():
+    """Test that the transport posts cached query text and decodes the result."""
+    requests = []
+
+    async def graphql(request):
+        requests.append(await request.json())
+        return web.json_response({"data": {"roles": [{"id": "r1"}]}})
+
+    app = web.Application()
+    app.router.add_post("/graphql", graphql)
+    document = _parse_query("query ListRoleIds { roles { id } }")
+
+    async with TestServer(app) as server:
+        transport = client._PantherTransport(url=str(server.make_url("/graphql")))
+        await transport.connect()
+        try:
+            with mock.patch(
+                "mcp_panther.panther_mcp_core.client.print_ast",
+                wraps=client.print_ast,
+            ) as mock_print:
+                first = await transport.execute(document, {"a": 1})
+                second = await transport.execute(document)
+        finally:
+            await transport.close()
+
+    assert first.data == second.data == {"roles": [{"id": "r1"}]}
+    assert requests[0] == {"query": requests[1]["query"], "variables": {"a": 1}}
+    assert "ListRoleIds" in requests[0]["query"]
+    mock_print.assert_called_once_with(document)
+    # Only the transport's copy of execute sees the cached printer
+    assert gql_aiohttp.print_ast is client.print_ast
+
+
+@pytest.mark.asyncio
+async def test_panther_transport_execute_raw_returns_body():
+    """Test that execute_raw returns the body as sent and raises on HTTP errors."""
+    payload = b'{"data":{"roles":[{"id":"r1"}]}}'
+
+    async def graphql(request):
+        return web.Response(body=payload, content_type="application/json")
+
+    async def failing(request):
+        return web.Response(status=500)
+
+    app = web.Application()
+    app.router.add_post("/graphql", graphql)
+    app.router.add_post("/failing", failing)
+    document = _parse_query("query ListRoleIds { roles { id } }")
+
+    async with TestServer(app) as server:
+        transport = client._PantherTransport(url=str(server.make_url("/graphql")))
+        await transport.connect()
+        try:
+            body = await transport.execute_raw(document, {"a": 1})
+            transport.url = str(server.make_url("/failing"))
+            with pytest.raises(TransportServerError):
+                await transport.execute_raw(document)
+        finally:
+            await transport.close()
+
+    assert body == payload
+
+
+@pytest.mark.asyncio
+async def test_rest_client_session_persists_across_contexts():
+    """Test that exiting the client context does not close the shared session."""
+    rest_client = PantherRestClient()
+    with mock.patch(
+        "mcp_panther.panther_mcp_core.client.get_panther_rest_api_base",
+        return_value="http://example.com",
+    ):
+        async with rest_client as c:
+            session = c._session
+        async with rest_client as c:
+            assert c._session is session
+
+    assert not session.closed
+    await rest_client.close()
+    assert session.closed
+    assert rest_client._session is None
+
+
+def test_today_date_range_formats():
+    """Test that the string date range matches the datetime date range."""
+    start, end = get_today_date_range()
+    start_str, end_str = _get_today_date_range()
+
+    assert end - start == datetime.timedelta(days=1)
+    assert start.hour == start.minute == start.second == start.microsecond == 0
+    assert start_str == start.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    assert end_str == end.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+@pytest.mark.asyncio
+async def test_rest_client_request_methods():
+    """Test that each REST method sends the right verb and validates the status."""
+    mock_response = mock.Mock(spec=ClientResponse)
+    mock_response.status = 200
+    mock_response.json = mock.AsyncMock(return_value={"id": "rule-1"})
+
+    rest_client = PantherRestClient()
+    with (
+        mock.patch(
+            "mcp_panther.panther_mcp_core.client.get_panther_rest_api_base",
+            return_value="http://example.com",
+        ),
+        mock.patch("aiohttp.ClientSession.request") as mock_request,
+    ):
+        mock_request.return_value.__aenter__.return_value = mock_response
+
+        assert await rest_client.get("/rules", params={"limit": 1}) == (
+            {"id": "rule-1"},
+            200,
+        )
+        method, url = mock_request.call_args.args
+        assert (method, url) == ("GET", "http://example.com/rules")
+        assert mock_request.call_args.kwargs["params"] == {"limit": 1}
+
+        await rest_client.put("/rules/rule-1", json_data={"enabled": False})
+        method, url = mock_request.call_args.args
+        assert (method, url) == ("PUT", "http://example.com/rules/rule-1")
+        assert mock_request.call_args.kwargs["json"] == {"enabled": False}
+
+        mock_response.status = 404
+        with pytest.raises(Exception, match="HTTP 404"):
+            await rest_client.delete("/rules/rule-1")
+
+    await rest_client.close()
+
+
+@pytest.mark.asyncio
+async def test_rest_client_gather_get():
+    """Test that gather_get issues one GET per path and preserves order."""
+    rest_client = PantherRestClient()
+
+    async def fake_get(path, params=None, expected_codes=None):
+        return {"path": path, "params": params}, 200
+
+    with mock.patch.object(rest_client, "get", side_effect=fake_get) as mock_get:
+        results = await rest_client.gather_get(
+            ["/rules/a", "/rules/b"], params=[None, {"limit": 1}]
+        )
+
+    assert results == [
+        ({"path": "/rules/a", "params": None}, 200),
+        ({"path": "/rules/b", "params": {"limit": 1}}, 200),
+    ]
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rest_client_gather_post():
+    """Test that gather_post keeps the order of the request bodies."""
+    rest_client = PantherRestClient()
+
+    async def fake_post(path, json_data=None, params=None, expected_codes=None):
+        # Finish the first request last, so results come back out of order
+        await asyncio.sleep(0.01 if json_data["n"] == 1 else 0)
+        return {"path": path, "n": json_data["n"], "params": params}, 201
+
+    with mock.patch.object(rest_client, "post", side_effect=fake_post):
+        results = await rest_client.gather_post(
+            "/alert-comments", [{"n": 1}, {"n": 2}], params={"x": "y"}
+        )
+
+    assert results == [
+        ({"path": "/alert-comments", "n": 1, "params": {"x": "y"}}, 201),
+        ({"path": "/alert-comments", "n": 2, "params": {"x": "y"}}, 201),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rest_client_gather_post_raises_on_failure():
+    """Test that gather_post raises the error of a failed request."""
+    rest_client = PantherRestClient()
+
+    async def fake_post(path, json_data=None, params=None, expected_codes=None):
+        if json_data["n"] == 2:
+            raise ValueError("HTTP 400")
+        return {"n": json_data["n"]}, 201
+
+    with mock.patch.object(rest_client, "post", side_effect=fake_post):
+        with pytest.raises(ValueError, match="HTTP 400"):
+            await rest_client.gather_post("/alert-comments", [{"n": 1}, {"n": 2}])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_ijson", [True, False])
+async def test_rest_client_stream_get(monkeypatch, use_ijson):
+    """Test that stream_get yields each item found at the prefix."""
+    if use_ijson and client.ijson is None:
+        pytest.skip("ijson is not installed")
+    if not use_ijson:
+        monkeypatch.setattr(client, "ijson", None)
+
+    body = b'{"results": [{"id": "a"}, {"id": "b"}], "next": null}'
+    mock_response = _mock_html_response(200)
+    mock_response.json = mock.AsyncMock(return_value=json.loads(body))
+    mock_response.content.read = mock.AsyncMock(side_effect=io.BytesIO(body).read)
+
+    rest_client = PantherRestClient()
+    with (
+        mock.patch(
+            "mcp_panther.panther_mcp_core.client.get_panther_rest_api_base",
+            return_value="http://example.com",
+        ),
+        mock.patch("aiohttp.ClientSession.request") as mock_request,
+    ):
+        mock_request.return_value.__aenter__.return_value = mock_response
+        items = [item async for item in rest_client.stream_get("/rules")]
+
+    assert items == [{"id": "a"}, {"id": "b"}]
+    await rest_client.close()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_serialize_tool_result(monkeypatch, use_orjson):
+    """Test that tool results serialize to indented JSON with a str fallback."""
+    if use_orjson and client.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(client, "orjson", None)
+
+    when = datetime.datetime(2024, 3, 20, tzinfo=datetime.timezone.utc)
+    serialized = serialize_tool_result({"success": True, "when": when})
+
+    assert serialized.startswith('{\n  "success": true')
+    assert json.loads(serialized)["success"] is True
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_serialize_tool_result_embeds_raw_json(monkeypatch, use_orjson):
+    """Test that RawJSON values are embedded as JSON rather than as a string."""
+    if use_orjson and client.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(client, "orjson", None)
+
+    serialized = serialize_tool_result({"raw": RawJSON(b'{"data": {"n": 1}}')})
+
+    assert json.loads(serialized) == {"raw": {"data": {"n": 1}}}
+
+
+@pytest.mark.asyncio
+async def test_create_panther_client_sizes_connection_pool():
+    """Test that the GraphQL transport uses the tuned connection pool and JSON codec."""
+    with (
+        mock.patch.object(
+            client, "get_panther_gql_endpoint", return_value="http://example.com"
+        ),
+        mock.patch.object(client, "get_panther_api_key", return_value="key"),
+    ):
+        gql_client = await client._create_panther_client()
+
+    session_args = gql_client.transport.client_session_args
+    connector = session_args["connector"]
+    try:
+        assert connector.limit == client._CONNECTOR_LIMIT
+        assert connector.limit_per_host == client._CONNECTOR_LIMIT_PER_HOST
+        assert session_args["response_class"] is client._JSONClientResponse
+        assert gql_client.transport.json_serialize is client._json_dumps
+    finally:
+        await connector.close()
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_gc_paused_restores_previous_state(enabled):
+    """Test that garbage collection is paused inside the block and then restored."""
+    was_enabled = gc.isenabled()
+    (gc.enable if enabled else gc.disable)()
+    try:
+        with client._gc_paused():
+            assert not gc.isenabled()
+        assert gc.isenabled() is enabled
+    finally:
+        (gc.enable if was_enabled else gc.disable)()
@@ -0,0 +1,103 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from mcp_panther.panther_mcp_core.client_batch import AsyncBatcher
+
+
+@pytest.mark.asyncio
+async def test_batcher_merges_concurrent_submissions():
+    """Test that concurrent submissions with the same key share one call."""
+    execute = mock.AsyncMock(side_effect=lambda ids: [{"id": i} for i in ids])
+    batcher = AsyncBatcher(delay=0.001)
+
+    first, second = await asyncio.gather(
+        batcher.submit("key", ["a", "b"], execute),
+        batcher.submit("key", ["b", "c"], execute),
+    )
+
+    execute.assert_awaited_once_with(["a", "b", "c"])
+    assert first == [{"id": "a"}, {"id": "b"}]
+    assert second == [{"id": "b"}, {"id": "c"}]
+
+
+@pytest.mark.asyncio
+async def test_batcher_keeps_keys_separate():
+    """Test that submissions with different keys are not merged."""
+    execute = mock.AsyncMock(side_effect=lambda ids: [{"id": i} for i in ids])
+    batcher = AsyncBatcher(delay=0.001)
+
+    await asyncio.gather(
+        batcher.submit("open", ["a"], execute),
+        batcher.submit("closed", ["b"], execute),
+    )
+
+    assert execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_at_max_size():
+    """Test that a full batch is sent without waiting for the delay."""
+    execute = mock.AsyncMock(side_effect=lambda ids: [{"id": i} for i in ids])
+    batcher = AsyncBatcher(delay=60, max_size=2)
+
+    result = await asyncio.wait_for(batcher.submit("key", ["a", "b"], execute), 1)
+
+    assert result == [{"id": "a"}, {"id": "b"}]
+
+
+@pytest.mark.asyncio
+async def test_batcher_splits_batches_at_max_size():
+    """Test that a submission never pushes a batch past max_size."""
+    execute = mock.AsyncMock(side_effect=lambda ids: [{"id": i} for i in ids])
+    batcher = AsyncBatcher(delay=0.001, max_size=2)
+
+    first, second = await asyncio.gather(
+        batcher.submit("key", ["a"], execute),
+        batcher.submit("key", ["b", "c", "d"], execute),
+    )
+
+    assert [call.args[0] for call in execute.await_args_list] == [
+        ["a", "b"],
+        ["c", "d"],
+    ]
+    assert first == [{"id": "a"}]
+    assert second == [{"id": "b"}, {"id": "c"}, {"id": "d"}]
+
+
+@pytest.mark.asyncio
+async def test_batcher_retries_callers_separately_on_failure():
+    """Test that one caller's failure does not fail the rest of the batch."""
+
+    async def execute(ids):
+        if "bad" in ids:
+            raise Exception("Test error")
+        return [{"id": i} for i in ids]
+
+    batcher = AsyncBatcher(delay=0.001)
+
+    good, bad = await asyncio.gather(
+        batcher.submit("key", ["a"], execute),
+        batcher.submit("key", ["bad"], execute),
+        return_exceptions=True,
+    )
+
+    assert good == [{"id": "a"}]
+    assert str(bad) == "Test error"
+
+
+@pytest.mark.asyncio
+async def test_batcher_propagates_errors_to_all_callers():
+    """Test that a failure is reported to every caller whose retry also fails."""
+    execute = mock.AsyncMock(side_effect=Exception("Test error"))
+    batcher = AsyncBatcher(delay=0.001)
+
+    results = await asyncio.gather(
+        batcher.submit("key", ["a"], execute),
+        batcher.submit("key", ["b"], execute),
+        return_exceptions=True,
+    )
+
+    assert execute.await_count == 3
+    assert all(str(result) == "Test error" for result in results)
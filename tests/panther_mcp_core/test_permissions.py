@@ -21,6 +21,14 @@ def test_permission_enum():
     assert Permission.USER_READ.value == "View Users"
 
 
+def test_permission_values_are_interned():
+    """Test that permission titles from enums and strings share one object."""
+    title = "".join(["View ", "Alerts"])
+    result = perms(any_of=[Permission.ALERT_READ, title])
+    assert result["any_of"][0] is Permission.ALERT_READ.value
+    assert result["any_of"][1] is Permission.ALERT_READ.value
+
+
 def test_convert_permissions():
     """Test converting raw permission strings to Permission enums."""
     raw_perms = ["RuleRead", "PolicyRead", "InvalidPerm"]
@@ -0,0 +1,33 @@
+from graphql import DocumentNode
+
+from mcp_panther.panther_mcp_core import queries
+
+
+def test_query_constants_are_precompiled():
+    """Test that every query and mutation is parsed once at import time."""
+    documents = {
+        name: value
+        for name, value in vars(queries).items()
+        if name.endswith(("_QUERY", "_MUTATION"))
+    }
+
+    assert documents
+    for name, value in documents.items():
+        assert isinstance(value, DocumentNode), name
+
+
+def test_alerts_query_for_fields_is_cached():
+    """Test that narrowed alert queries are built once per set of fields."""
+    fields = frozenset({"id", "title"})
+
+    assert queries.get_alerts_query_for_fields(
+        fields
+    ) is queries.get_alerts_query_for_fields(frozenset({"title", "id"}))
+
+
+def test_tables_query_for_databases_is_cached():
+    """Test that aliased table queries are parsed once per database count."""
+    document = queries.get_tables_query_for_databases(3)
+
+    assert isinstance(document, DocumentNode)
+    assert document is queries.get_tables_query_for_databases(3)
@@ -1,4 +1,7 @@
+import asyncio
+
 import pytest
+from graphql import print_ast
 
 from mcp_panther.panther_mcp_core.tools.alerts import (
     add_alert_comment,
@@ -6,6 +9,7 @@ from mcp_panther.panther_mcp_core.tools.alerts import (
     get_alert_events,
     list_alert_comments,
     list_alerts,
+    list_alerts_with_events,
     update_alert_assignee_by_id,
     update_alert_status,
 )
@@ -53,6 +57,13 @@ MOCK_ALERTS_RESPONSE = {
 ALERTS_MODULE_PATH = "mcp_panther.panther_mcp_core.tools.alerts"
 
 
+@pytest.fixture(autouse=True)
+def clear_alert_caches():
+    """Start every test with empty alert read caches."""
+    get_alert_by_id.cache_clear()
+    list_alert_comments.cache_clear()
+
+
 @pytest.mark.asyncio
 @patch_graphql_client(ALERTS_MODULE_PATH)
 async def test_list_alerts_success(mock_graphql_client):
@@ -136,6 +147,48 @@ async def test_list_alerts_with_filters(mock_graphql_client):
     assert call_args["input"]["nameContains"] == "Test"
 
 
+@pytest.mark.asyncio
+@patch_graphql_client(ALERTS_MODULE_PATH)
+async def test_list_alerts_skips_unset_filters(mock_graphql_client):
+    """Test that empty filters are omitted while zero event counts are kept."""
+    mock_graphql_client.execute.return_value = MOCK_ALERTS_RESPONSE
+
+    await list_alerts(event_count_min=0, log_types=[], name_contains="")
+
+    call_args = mock_graphql_client.execute.call_args[1]["variable_values"]
+    assert call_args["input"]["eventCountMin"] == 0
+    assert "logTypes" not in call_args["input"]
+    assert "nameContains" not in call_args["input"]
+    assert "cursor" not in call_args["input"]
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(ALERTS_MODULE_PATH)
+async def test_list_alerts_with_fields(mock_graphql_client):
+    """Test that requesting fields narrows the query selection."""
+    mock_graphql_client.execute.return_value = MOCK_ALERTS_RESPONSE
+
+    result = await list_alerts(fields=["title", "severity"])
+
+    assert result["success"] is True
+    query_text = print_ast(mock_graphql_client.execute.call_args[0][0])
+    assert "title" in query_text
+    assert "severity" in query_text
+    assert "id" in query_text
+    assert "description" not in query_text
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(ALERTS_MODULE_PATH)
+async def test_list_alerts_with_invalid_fields(mock_graphql_client):
+    """Test handling of unknown alert fields."""
+    result = await list_alerts(fields=["title", "bogus"])
+
+    assert result["success"] is False
+    assert "Invalid fields ['bogus']" in result["message"]
+    mock_graphql_client.execute.assert_not_called()
+
+
 @pytest.mark.asyncio
 @patch_graphql_client(ALERTS_MODULE_PATH)
 async def test_list_alerts_with_detection_id(mock_graphql_client):
@@ -215,6 +268,39 @@ async def test_get_alert_by_id_not_found(mock_graphql_client):
     assert "No alert found" in result["message"]
 
 
+@pytest.mark.asyncio
+@patch_graphql_client(ALERTS_MODULE_PATH)
+async def test_get_alert_by_id_is_cached(mock_graphql_client):
+    """Test that repeat reads of an alert are served from the cache."""
+    mock_graphql_client.execute.return_value = {"alert": MOCK_ALERT}
+
+    first = await get_alert_by_id(MOCK_ALERT["id"])
+    second = await get_alert_by_id(alert_id=MOCK_ALERT["id"])
+
+    assert first == second
+    assert first is not second
+    mock_graphql_client.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch_execute_query(ALERTS_MODULE_PATH)
+@patch_graphql_client(ALERTS_MODULE_PATH)
+async def test_update_alert_status_invalidates_cached_alert(
+    mock_graphql_client, mock_execute_query
+):
+    """Test that updating an alert's status drops its cached details."""
+    mock_graphql_client.execute.return_value = {"alert": MOCK_ALERT}
+    mock_execute_query.return_value = {
+        "updateAlertStatusById": {"alerts": [{**MOCK_ALERT, "status": "TRIAGED"}]}
+    }
+
+    await get_alert_by_id(MOCK_ALERT["id"])
+    await update_alert_status([MOCK_ALERT["id"]], "TRIAGED")
+    await get_alert_by_id(MOCK_ALERT["id"])
+
+    assert mock_graphql_client.execute.call_count == 2
+
+
 @pytest.mark.asyncio
 @patch_graphql_client(ALERTS_MODULE_PATH)
 async def test_get_alert_by_id_error(mock_graphql_client):
@@ -249,6 +335,31 @@ async def test_update_alert_status_success(mock_execute_query):
     assert call_args[0][1]["input"]["status"] == "TRIAGED"
 
 
+@pytest.mark.asyncio
+@patch_execute_query(ALERTS_MODULE_PATH)
+async def test_update_alert_status_batches_concurrent_calls(mock_execute_query):
+    """Test that concurrent status updates are sent as a single mutation."""
+    mock_execute_query.return_value = {
+        "updateAlertStatusById": {
+            "alerts": [
+                {**MOCK_ALERT, "status": "TRIAGED"},
+                {**MOCK_ALERT, "id": "alert-456", "status": "TRIAGED"},
+            ]
+        }
+    }
+
+    first, second = await asyncio.gather(
+        update_alert_status([MOCK_ALERT["id"]], "TRIAGED"),
+        update_alert_status(["alert-456"], "TRIAGED"),
+    )
+
+    mock_execute_query.assert_called_once()
+    call_args = mock_execute_query.call_args
+    assert call_args[0][1]["input"]["ids"] == [MOCK_ALERT["id"], "alert-456"]
+    assert [alert["id"] for alert in first["alerts"]] == [MOCK_ALERT["id"]]
+    assert [alert["id"] for alert in second["alerts"]] == ["alert-456"]
+
+
 @pytest.mark.asyncio
 async def test_update_alert_status_invalid_status():
     """Test handling of invalid status value."""
@@ -428,6 +539,43 @@ async def test_get_alert_events_error(mock_rest_client):
     assert "Failed to fetch alert events" in result["message"]
 
 
+@pytest.mark.asyncio
+@patch_graphql_client(ALERTS_MODULE_PATH)
+@patch_rest_client(ALERTS_MODULE_PATH)
+async def test_list_alerts_with_events_success(mock_rest_client, mock_graphql_client):
+    """Test that events are fetched for every alert on the page."""
+    mock_graphql_client.execute.return_value = MOCK_ALERTS_RESPONSE
+    mock_rest_client.get.side_effect = [
+        ({"results": [{"p_row_id": "event-1"}]}, 200),
+        ({}, 404),
+    ]
+
+    result = await list_alerts_with_events(events_per_alert=5)
+
+    assert result["success"] is True
+    assert result["total_alerts"] == 2
+    assert result["alerts"][0]["events"] == [{"p_row_id": "event-1"}]
+    assert result["alerts"][1]["events"] == []
+    assert mock_rest_client.get.call_count == 2
+    first_call = mock_rest_client.get.call_args_list[0]
+    assert first_call.args[0] == f"/alerts/{MOCK_ALERT['id']}/events"
+    assert first_call.kwargs["params"] == {"limit": 5}
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(ALERTS_MODULE_PATH)
+@patch_rest_client(ALERTS_MODULE_PATH)
+async def test_list_alerts_with_events_error(mock_rest_client, mock_graphql_client):
+    """Test handling of errors when fetching events for alerts."""
+    mock_graphql_client.execute.return_value = MOCK_ALERTS_RESPONSE
+    mock_rest_client.get.side_effect = Exception("Test error")
+
+    result = await list_alerts_with_events()
+
+    assert result["success"] is False
+    assert "Failed to fetch alerts with events" in result["message"]
+
+
 @pytest.mark.asyncio
 async def test_get_alert_events_invalid_limit():
     """Test handling of invalid limit value."""
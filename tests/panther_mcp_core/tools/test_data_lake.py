@@ -1,10 +1,23 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
+from mcp_panther.panther_mcp_core.client import serialize_tool_result
 from mcp_panther.panther_mcp_core.tools.data_lake import (
+    _fetch_tables_for_databases,
     _is_name_normalized,
     _normalize_name,
     execute_data_lake_query,
+    get_data_lake_query_results,
     get_sample_log_events,
+    get_table_schema,
+    list_database_tables,
+    list_database_tables_paged,
+    list_databases,
+    list_tables_for_databases,
+    summarize_alert_events,
 )
 from tests.utils.helpers import patch_graphql_client
 
@@ -13,6 +26,14 @@ DATA_LAKE_MODULE_PATH = "mcp_panther.panther_mcp_core.tools.data_lake"
 MOCK_QUERY_ID = "query-123456789"
 
 
+@pytest.fixture(autouse=True)
+def clear_schema_caches():
+    """Start every test with empty schema caches."""
+    list_databases.cache_clear()
+    list_database_tables.cache_clear()
+    get_table_schema.cache_clear()
+
+
 @pytest.mark.asyncio
 @patch_graphql_client(DATA_LAKE_MODULE_PATH)
 async def test_get_sample_log_events_success(mock_graphql_client):
@@ -143,6 +164,8 @@ async def test_execute_data_lake_query_with_event_time(mock_graphql_client):
         "SELECT * FROM panther_logs.public.aws_cloudtrail WHERE aws_cloudtrail.p_event_time >= DATEADD(day, -30, CURRENT_TIMESTAMP()) LIMIT 10",
         "SELECT * FROM panther_logs.public.aws_cloudtrail t1 WHERE t1.p_event_time >= DATEADD(day, -30, CURRENT_TIMESTAMP()) LIMIT 10",
         "SELECT * FROM panther_logs.public.aws_cloudtrail t1 WHERE other_condition AND t1.p_event_time >= DATEADD(day, -30, CURRENT_TIMESTAMP()) LIMIT 10",
+        # Test multi-line queries with mixed case keywords
+        "SELECT *\nFROM panther_logs.public.aws_cloudtrail\nWhere other_condition\n  And P_EVENT_TIME\n  >= DATEADD(day, -30, CURRENT_TIMESTAMP())",
     ]
 
     for sql in valid_queries:
@@ -186,6 +209,483 @@ async def test_execute_data_lake_query_invalid_event_time_usage(mock_graphql_cli
         mock_graphql_client.execute.assert_not_called()
 
 
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_summarize_alert_events_quotes_values(mock_graphql_client):
+    """Test that unique alert IDs and dates are sent as sorted, quoted SQL strings."""
+    mock_graphql_client.execute.return_value = {
+        "executeDataLakeQuery": {"id": MOCK_QUERY_ID}
+    }
+
+    result = await summarize_alert_events(
+        ["it's", "alert-1", "it's"],
+        time_window=5,
+        start_date="2025-04-22 00:00:00Z",
+        end_date="2025-04-23 00:00:00Z",
+    )
+
+    assert result["success"] is True
+    variables = mock_graphql_client.execute.call_args[1]["variable_values"]
+    sql = variables["input"]["sql"]
+    assert "cs.p_alert_id IN ('alert-1', 'it''s')" in sql
+    assert "BETWEEN '2025-04-22 00:00:00Z' AND '2025-04-23 00:00:00Z'" in sql
+    assert "time_5_minute" in sql
+    assert variables["input"]["databaseName"] == "panther_signals.public"
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_list_database_tables_follows_pages(mock_graphql_client):
+    """Test that every page of tables is fetched and tagged with the database."""
+    mock_graphql_client.execute.side_effect = [
+        {
+            "dataLakeDatabaseTables": {
+                "edges": [{"node": {"name": "aws_cloudtrail"}}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"},
+            }
+        },
+        {
+            "dataLakeDatabaseTables": {
+                "edges": [{"node": {"name": "okta_systemlog"}}],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        },
+    ]
+
+    result = await list_database_tables("panther_logs.public")
+
+    assert result["success"] is True
+    assert result["tables"] == [
+        {"name": "aws_cloudtrail", "database": "panther_logs.public"},
+        {"name": "okta_systemlog", "database": "panther_logs.public"},
+    ]
+    assert result["stats"]["table_count"] == 2
+    second_call = mock_graphql_client.execute.call_args_list[1]
+    assert second_call[1]["variable_values"]["cursor"] == "cursor-1"
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_list_database_tables_is_cached(mock_graphql_client):
+    """Test that tables are fetched once for repeated calls on a database."""
+    mock_graphql_client.execute.return_value = {
+        "dataLakeDatabaseTables": {
+            "edges": [{"node": {"name": "aws_cloudtrail"}}],
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+        }
+    }
+
+    first = await list_database_tables("panther_logs.public")
+    second = await list_database_tables(database="panther_logs.public")
+
+    assert first == second
+    assert first is not second
+    mock_graphql_client.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_list_database_tables_paged(mock_graphql_client):
+    """Test that a single page of tables is returned with its cursor."""
+    mock_graphql_client.execute.return_value = {
+        "dataLakeDatabaseTables": {
+            "edges": [{"node": {"name": "aws_cloudtrail"}}],
+            "pageInfo": {"hasNextPage": True, "endCursor": "cursor-2"},
+        }
+    }
+
+    result = await list_database_tables_paged(
+        "panther_logs.public", cursor="cursor-1", page_size=1
+    )
+
+    assert result["success"] is True
+    assert result["tables"] == [
+        {"name": "aws_cloudtrail", "database": "panther_logs.public"}
+    ]
+    assert result["has_next_page"] is True
+    assert result["end_cursor"] == "cursor-2"
+    mock_graphql_client.execute.assert_called_once()
+    variables = mock_graphql_client.execute.call_args[1]["variable_values"]
+    assert variables["cursor"] == "cursor-1"
+    assert variables["pageSize"] == 1
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_list_tables_for_databases(mock_graphql_client):
+    """Test that the tool lists every database's tables in one aliased request."""
+    mock_graphql_client.execute.return_value = {
+        "db0": {
+            "edges": [{"node": {"name": "aws_cloudtrail"}}],
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+        },
+        "db1": {
+            "edges": [{"node": {"name": "classification_failures"}}],
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+        },
+    }
+
+    result = await list_tables_for_databases(
+        ["panther_logs.public", "panther_monitor.public", "panther_logs.public"]
+    )
+
+    assert result["success"] is True
+    assert list(result["tables"]) == ["panther_logs.public", "panther_monitor.public"]
+    assert result["stats"]["table_count"] == 2
+    mock_graphql_client.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_tables_for_databases_batches_first_pages():
+    """Test that first pages share one request and only unfinished databases page on."""
+    session = AsyncMock()
+    session.execute.side_effect = [
+        {
+            "db0": {
+                "edges": [{"node": {"name": "aws_cloudtrail"}}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"},
+            },
+            "db1": {
+                "edges": [{"node": {"name": "classification_failures"}}],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            },
+        },
+        {
+            "dataLakeDatabaseTables": {
+                "edges": [{"node": {"name": "okta_systemlog"}}],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        },
+    ]
+
+    result = await _fetch_tables_for_databases(
+        session, ["panther_logs.public", "panther_monitor.public"]
+    )
+
+    assert [table["name"] for table in result["panther_logs.public"]] == [
+        "aws_cloudtrail",
+        "okta_systemlog",
+    ]
+    assert result["panther_monitor.public"] == [
+        {"name": "classification_failures", "database": "panther_monitor.public"}
+    ]
+    assert session.execute.call_count == 2
+    first_call = session.execute.call_args_list[0][1]["variable_values"]
+    assert first_call["db0"] == "panther_logs.public"
+    assert first_call["db1"] == "panther_monitor.public"
+    second_call = session.execute.call_args_list[1][1]["variable_values"]
+    assert second_call["databaseName"] == "panther_logs.public"
+    assert second_call["cursor"] == "cursor-1"
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_list_databases_is_cached(mock_graphql_client):
+    """Test that databases are fetched once for repeated and concurrent calls."""
+    mock_graphql_client.execute.return_value = {
+        "dataLakeDatabases": [{"name": "panther_logs.public", "description": ""}]
+    }
+
+    results = await asyncio.gather(list_databases(), list_databases())
+    results.append(await list_databases())
+
+    assert all(result["success"] for result in results)
+    mock_graphql_client.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_table_schema_does_not_cache_failures(mock_graphql_client):
+    """Test that a failed column lookup is retried on the next call."""
+    mock_graphql_client.execute.side_effect = [
+        Exception("Test error"),
+        {"t0": {"name": "aws_cloudtrail", "columns": [{}]}},
+    ]
+
+    first = await get_table_schema("panther_logs.public", "aws_cloudtrail")
+    second = await get_table_schema("panther_logs.public", "aws_cloudtrail")
+
+    assert first["success"] is False
+    assert second["success"] is True
+    assert mock_graphql_client.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_paginates(mock_graphql_client):
+    """Test that page size and cursor are forwarded and the next cursor returned."""
+    mock_graphql_client.execute.return_value = {
+        "dataLakeQuery": {
+            "status": "succeeded",
+            "results": {
+                "edges": [{"node": {"n": 1}}, {"node": {"n": 2}}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "cursor-2"},
+            },
+        }
+    }
+
+    result = await get_data_lake_query_results(
+        MOCK_QUERY_ID, page_size=2, cursor="cursor-1"
+    )
+
+    assert result["success"] is True
+    assert result["results"] == [{"n": 1}, {"n": 2}]
+    assert result["has_next_page"] is True
+    assert result["end_cursor"] == "cursor-2"
+    variables = mock_graphql_client.execute.call_args[1]["variable_values"]
+    assert variables["pageSize"] == 2
+    assert variables["cursor"] == "cursor-1"
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_columnar(mock_graphql_client):
+    """Test that columnar results hold one list of values per column."""
+    mock_graphql_client.execute.return_value = {
+        "dataLakeQuery": {
+            "status": "succeeded",
+            "results": {
+                "edges": [
+                    {"node": {"n": 1, "name": "a"}},
+                    {"node": {"n": 2}},
+                ],
+                "columnInfo": {"order": ["n", "name"], "types": {}},
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            },
+        }
+    }
+
+    result = await get_data_lake_query_results(
+        MOCK_QUERY_ID, cursor="cursor-1", columnar=True
+    )
+
+    assert result["results"] == {"n": [1, 2], "name": ["a", None]}
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_raw(mock_graphql_client):
+    """Test that raw mode passes the rows' response body through undecoded."""
+    body = b'{"data":{"dataLakeQuery":{"status":"succeeded","results":{}}}}'
+    mock_graphql_client.execute.return_value = {
+        "dataLakeQuery": {"status": "succeeded"}
+    }
+    mock_graphql_client.client.transport.execute_raw.return_value = body
+
+    result = await get_data_lake_query_results(
+        MOCK_QUERY_ID, cursor="cursor-1", raw=True
+    )
+
+    assert result["raw_json"].body == body
+    variables = mock_graphql_client.execute.call_args[1]["variable_values"]
+    assert variables["includeResults"] is False
+    raw_variables = mock_graphql_client.client.transport.execute_raw.call_args[0][1]
+    assert raw_variables["includeResults"] is True
+    assert json.loads(serialize_tool_result(result)) == {
+        "success": True,
+        "status": "succeeded",
+        "raw_json": json.loads(body),
+    }
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_running_skips_results(mock_graphql_client):
+    """Test that a running query is reported without requesting result rows."""
+    mock_graphql_client.execute.return_value = {"dataLakeQuery": {"status": "running"}}
+
+    result = await get_data_lake_query_results(MOCK_QUERY_ID)
+
+    assert result["status"] == "running"
+    mock_graphql_client.execute.assert_called_once()
+    variables = mock_graphql_client.execute.call_args[1]["variable_values"]
+    assert variables["includeResults"] is False
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_fetches_rows_after_success(
+    mock_graphql_client,
+):
+    """Test that result rows are requested once the query has succeeded."""
+    mock_graphql_client.execute.side_effect = [
+        {"dataLakeQuery": {"status": "succeeded"}},
+        {
+            "dataLakeQuery": {
+                "status": "succeeded",
+                "results": {"edges": [{"node": {"n": 1}}]},
+            }
+        },
+    ]
+
+    result = await get_data_lake_query_results(MOCK_QUERY_ID)
+
+    assert result["success"] is True
+    assert result["results"] == [{"n": 1}]
+    first_call, second_call = mock_graphql_client.execute.call_args_list
+    assert first_call[1]["variable_values"]["includeResults"] is False
+    assert second_call[1]["variable_values"]["includeResults"] is True
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_table_schema_batches_concurrent_lookups(mock_graphql_client):
+    """Test that concurrent lookups for different tables share one request."""
+    mock_graphql_client.execute.return_value = {
+        "t0": {"name": "aws_cloudtrail", "columns": [{"name": "eventName"}]},
+        "t1": {"name": "okta_systemlog", "columns": [{"name": "actor"}]},
+    }
+
+    cloudtrail, okta = await asyncio.gather(
+        get_table_schema("panther_logs.public", "aws_cloudtrail"),
+        get_table_schema("panther_logs.public", "okta_systemlog"),
+    )
+
+    assert cloudtrail["name"] == "aws_cloudtrail"
+    assert okta["columns"] == [{"name": "actor"}]
+    mock_graphql_client.execute.assert_called_once()
+    variables = mock_graphql_client.execute.call_args[1]["variable_values"]
+    assert variables["t0Table"] == "aws_cloudtrail"
+    assert variables["t1Table"] == "okta_systemlog"
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_table_schema_without_descriptions(mock_graphql_client):
+    """Test that descriptions can be left out of the column lookup."""
+    mock_graphql_client.execute.return_value = {
+        "t0": {"name": "aws_cloudtrail", "columns": [{"name": "eventName"}]}
+    }
+
+    result = await get_table_schema(
+        "panther_logs.public", "aws_cloudtrail", include_descriptions=False
+    )
+
+    assert result["success"] is True
+    variables = mock_graphql_client.execute.call_args[1]["variable_values"]
+    assert variables["includeDescriptions"] is False
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_table_schema_isolates_failed_lookups(mock_graphql_client):
+    """Test that a bad table in a batch only fails its own lookup."""
+    mock_graphql_client.execute.side_effect = [
+        Exception("Table not found"),
+        {"t0": {"name": "aws_cloudtrail", "columns": [{"name": "eventName"}]}},
+        Exception("Table not found"),
+    ]
+
+    found, missing = await asyncio.gather(
+        get_table_schema("panther_logs.public", "aws_cloudtrail"),
+        get_table_schema("panther_logs.public", "missing"),
+    )
+
+    assert found["success"] is True
+    assert missing["success"] is False
+    assert "Table not found" in missing["message"]
+    assert mock_graphql_client.execute.call_count == 3
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_shares_concurrent_polls(
+    mock_graphql_client,
+):
+    """Test that concurrent identical polls share one request but are not cached."""
+
+    async def execute(*args, **kwargs):
+        # Yield to the event loop like a real request would
+        await asyncio.sleep(0)
+        return {"dataLakeQuery": {"status": "running"}}
+
+    mock_graphql_client.execute.side_effect = execute
+
+    first, second = await asyncio.gather(
+        get_data_lake_query_results(MOCK_QUERY_ID),
+        get_data_lake_query_results(query_id=MOCK_QUERY_ID),
+    )
+
+    assert first == second
+    assert first is not second
+    mock_graphql_client.execute.assert_called_once()
+
+    await get_data_lake_query_results(MOCK_QUERY_ID)
+    assert mock_graphql_client.execute.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_null_cursor(mock_graphql_client):
+    """Test that a "null" cursor starts from the first page."""
+    mock_graphql_client.execute.return_value = {"dataLakeQuery": {"status": "running"}}
+
+    await get_data_lake_query_results(MOCK_QUERY_ID, cursor="null")
+
+    variables = mock_graphql_client.execute.call_args[1]["variable_values"]
+    assert variables["cursor"] is None
+    assert variables["includeResults"] is False
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_error(mock_graphql_client):
+    """Test that errors are returned as a failure response."""
+    mock_graphql_client.execute.side_effect = Exception("Test error")
+
+    result = await get_data_lake_query_results(MOCK_QUERY_ID)
+
+    assert result == {
+        "success": False,
+        "message": "Failed to fetch data lake query results: Test error",
+    }
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_waits_for_completion(mock_graphql_client):
+    """Test that wait_seconds polls the status until the query finishes."""
+    mock_graphql_client.execute.side_effect = [
+        {"dataLakeQuery": {"status": "running"}},
+        {"dataLakeQuery": {"status": "running"}},
+        {"dataLakeQuery": {"status": "succeeded"}},
+        {
+            "dataLakeQuery": {
+                "status": "succeeded",
+                "results": {"edges": [{"node": {"n": 1}}]},
+            }
+        },
+    ]
+
+    with patch(f"{DATA_LAKE_MODULE_PATH}.asyncio.sleep") as mock_sleep:
+        result = await get_data_lake_query_results(MOCK_QUERY_ID, wait_seconds=30)
+
+    assert result["status"] == "succeeded"
+    assert result["results"] == [{"n": 1}]
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1]
+    include_results = [
+        call.kwargs["variable_values"]["includeResults"]
+        for call in mock_graphql_client.execute.call_args_list
+    ]
+    assert include_results == [False, False, False, True]
+
+
+@pytest.mark.asyncio
+@patch_graphql_client(DATA_LAKE_MODULE_PATH)
+async def test_get_data_lake_query_results_does_not_wait_by_default(
+    mock_graphql_client,
+):
+    """Test that a running query is returned immediately without wait_seconds."""
+    mock_graphql_client.execute.return_value = {"dataLakeQuery": {"status": "running"}}
+
+    with patch(f"{DATA_LAKE_MODULE_PATH}.asyncio.sleep") as mock_sleep:
+        result = await get_data_lake_query_results(MOCK_QUERY_ID)
+
+    assert result["status"] == "running"
+    mock_sleep.assert_not_called()
+    mock_graphql_client.execute.assert_called_once()
+
+
 def test_normalize_name():
     test_cases = [
         {"input": "@foo", "expected": "at_sign_foo"},
@@ -0,0 +1,28 @@
+from unittest import mock
+
+import pytest
+
+from mcp_panther import server
+
+
+@pytest.mark.asyncio
+async def test_sse_app_lifespan_closes_sessions_on_shutdown():
+    """Test that shared sessions are closed when the SSE app stops, not before."""
+    with mock.patch.object(server, "close_client_sessions") as mock_close:
+        async with server.sse_app_lifespan(mock.Mock()):
+            mock_close.assert_not_called()
+
+    mock_close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_stdio_closes_sessions_after_serving():
+    """Test that shared sessions are closed once the stdio server returns."""
+    with (
+        mock.patch.object(server.mcp, "run_stdio_async") as mock_run,
+        mock.patch.object(server, "close_client_sessions") as mock_close,
+    ):
+        await server.run_stdio()
+
+    mock_run.assert_awaited_once()
+    mock_close.assert_awaited_once()
@@ -1,3 +1,5 @@
+import importlib
+from contextlib import ExitStack
 from unittest.mock import AsyncMock, patch
 
 
@@ -67,8 +69,12 @@ def patch_graphql_client(module_path):
         assert result["success"] is True
     ```
 
+    The same mock also stands in for the shared session returned by
+    _get_gql_session, for modules that use it.
+
     Args:
-        module_path (str): The import path to the module containing _create_panther_client.
+        module_path (str): The import path to the module containing _create_panther_client
+            or _get_gql_session.
 
     Returns:
         function: Decorated test function with mock client injected
@@ -76,14 +82,24 @@ def patch_graphql_client(module_path):
 
     def decorator(test_func):
         async def wrapper(*args, **kwargs):
-            patch_obj = patch(f"{module_path}._create_panther_client")
             client = AsyncMock()
             client.execute = AsyncMock()
             client.__aenter__.return_value = client
             client.__aexit__.return_value = None
 
-            with patch_obj as mock_create_client:
-                mock_create_client.return_value = client
+            module = importlib.import_module(module_path)
+            with ExitStack() as stack:
+                if hasattr(module, "_create_panther_client"):
+                    stack.enter_context(
+                        patch(
+                            f"{module_path}._create_panther_client",
+                            return_value=client,
+                        )
+                    )
+                if hasattr(module, "_get_gql_session"):
+                    stack.enter_context(
+                        patch(f"{module_path}._get_gql_session", return_value=client)
+                    )
                 return await test_func(client, *args, **kwargs)
 
         return wrapper